@@ -27,6 +27,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List
 
+import numpy as np
+
 from response_yolo.analysis.mcft import solve_mcft_node
 from response_yolo.section.cross_section import CrossSection
 
@@ -75,97 +77,86 @@ def compute_shear_stress_distribution(
     if not layers:
         return []
 
+    section._ensure_soa()
     yb = section.y_bottom
     yt = section.y_top
+    h = yt - yb
+
+    n = len(layers)
+    y_mid = section._y_c
+    A = section._A_c
+    dy = y_mid - y_ref
+
+    # Parabolic shear strain profile, closed form over all layers
+    if h > 0:
+        eta = (y_mid - 0.5 * (yb + yt)) * (2.0 / h)
+        s = 1.5 * (1.0 - eta * eta)
+    else:
+        s = np.ones(n)
 
     # Step 1: Compute MCFT tangent at each layer
     # Each layer contributes to the global stiffness.
     # The condensed tangent maps (deps_x, dgamma) → (dsigma_x, dtau_xy).
-    layer_data = []
-    for lay in layers:
-        dy = lay.y_mid - y_ref
-        eps_x = eps_0 - phi * dy
-        s = CrossSection.shear_strain_profile(lay.y_mid, yb, yt)
-        gamma = gamma_xy0 * s
-
+    # The node solve stays scalar (it supplies per-layer condensed
+    # tangents); everything downstream works on the collected arrays.
+    j = np.empty(n)
+    k_g = np.empty(n)
+    t_x = np.empty(n)
+    t_g = np.empty(n)
+    eps_x_arr = eps_0 - phi * dy
+    gamma_arr = gamma_xy0 * s
+    for i, lay in enumerate(layers):
         state = solve_mcft_node(
-            eps_x=eps_x,
-            gamma_xy=gamma,
+            eps_x=float(eps_x_arr[i]),
+            gamma_xy=float(gamma_arr[i]),
             concrete=lay.material,
             rho_y=lay.rho_y,
             stirrup_material=lay.stirrup_material,
         )
-
-        layer_data.append({
-            "lay": lay,
-            "dy": dy,
-            "s": s,
-            "state": state,
-            # j = dsigma_x/deps_x * area, k = dsigma_x/dgamma * area
-            # These are the Bentz "j" and "k" terms for shear flow rate
-            "j": state.tangent_xx * lay.area,
-            "k_g": state.tangent_xg * lay.area,
-        })
+        # j = dsigma_x/deps_x * area, k = dsigma_x/dgamma * area
+        # These are the Bentz "j" and "k" terms for shear flow rate
+        j[i] = state.tangent_xx * A[i]
+        k_g[i] = state.tangent_xg * A[i]
+        t_x[i] = state.tangent_gx * A[i]
+        t_g[i] = state.tangent_gg * A[i]
 
     # Step 2: Assemble global 3×3 Jacobian J
-    # J maps [dε₀, dφ, dγ₀] → [dN, dM, dV]
-    # Row 0 (dN): sum over layers of j*(deps_x/deps_0) + k*(dgamma/dgamma_0)
+    # J maps [dε₀, dφ, dγ₀] → [dN, dM, dV] via the chain rule:
     #   deps_x/deps_0 = 1,  deps_x/dphi = -dy,  dgamma/dgamma_0 = s(y)
-    # Row 1 (dM): sum of -dy * [j*(1) + ...], etc.
-    # Row 2 (dV): sum of tau tangent terms
-    J = [[0.0, 0.0, 0.0],
-         [0.0, 0.0, 0.0],
-         [0.0, 0.0, 0.0]]
-
-    for ld in layer_data:
-        dy = ld["dy"]
-        s = ld["s"]
-        j = ld["j"]
-        k_g = ld["k_g"]
-        lay = ld["lay"]
-        st = ld["state"]
-
-        # dN/d(eps_0): j * d(eps_x)/d(eps_0) = j * 1
-        J[0][0] += j
-        # dN/d(phi): j * d(eps_x)/d(phi) = j * (-dy)
-        J[0][1] += j * (-dy)
-        # dN/d(gamma_0): k * d(gamma)/d(gamma_0) = k * s
-        J[0][2] += k_g * s
-
-        # dM/d(eps_0): -dy * [j * 1]
-        J[1][0] += -dy * j
-        # dM/d(phi): -dy * [j * (-dy)] = dy^2 * j
-        J[1][1] += dy * dy * j
-        # dM/d(gamma_0): -dy * [k * s]
-        J[1][2] += -dy * k_g * s
-
-        # dV contributions from shear tangent
-        tau_gx = st.tangent_gx * lay.area  # dtau/deps_x * area
-        tau_gg = st.tangent_gg * lay.area  # dtau/dgamma * area
-        J[2][0] += tau_gx
-        J[2][1] += tau_gx * (-dy)
-        J[2][2] += tau_gg * s
+    j_dy = float(np.dot(j, dy))
+    k_s = k_g * s
+    J = [
+        [float(j.sum()), -j_dy, float(k_s.sum())],
+        [-j_dy, float(np.dot(j, dy * dy)), -float(np.dot(k_s, dy))],
+        [float(t_x.sum()), -float(np.dot(t_x, dy)), float(np.dot(t_g, s))],
+    ]
 
     # Also add rebar/tendon stiffness to J (uniaxial, no shear contribution)
-    for bar in section.rebars:
-        dy = bar.y - y_ref
-        eps_x = eps_0 - phi * dy
-        Et = bar.material.tangent(eps_x)
-        ea = Et * bar.area
-        J[0][0] += ea
-        J[0][1] -= ea * dy
-        J[1][0] -= ea * dy
-        J[1][1] += ea * dy * dy
-
-    for t in section.tendons:
-        dy = t.y - y_ref
-        eps_x = eps_0 - phi * dy + t.prestrain
-        Et = t.material.tangent(eps_x)
-        ea = Et * t.area
-        J[0][0] += ea
-        J[0][1] -= ea * dy
-        J[1][0] -= ea * dy
-        J[1][1] += ea * dy * dy
+    if section.rebars:
+        dy_r = section._y_r - y_ref
+        eps_r = eps_0 - phi * dy_r
+        Et_r = np.empty_like(eps_r)
+        for mat, idx in section._rebar_groups:
+            Et_r[idx] = mat.tangent_vec(eps_r[idx])
+        ea_r = Et_r * section._A_r
+        ea_dy = float(np.dot(ea_r, dy_r))
+        J[0][0] += float(ea_r.sum())
+        J[0][1] -= ea_dy
+        J[1][0] -= ea_dy
+        J[1][1] += float(np.dot(ea_r, dy_r * dy_r))
+
+    if section.tendons:
+        dy_t = section._y_t - y_ref
+        eps_t = eps_0 - phi * dy_t + section._pre_t
+        Et_t = np.empty_like(eps_t)
+        for mat, idx in section._tendon_groups:
+            Et_t[idx] = mat.tangent_vec(eps_t[idx])
+        ea_t = Et_t * section._A_t
+        ea_dy = float(np.dot(ea_t, dy_t))
+        J[0][0] += float(ea_t.sum())
+        J[0][1] -= ea_dy
+        J[1][0] -= ea_dy
+        J[1][1] += float(np.dot(ea_t, dy_t * dy_t))
 
     # Step 3: Solve J * [dε₀, dφ, dγ₀] = [0, 1.0, 0]
     # This represents a virtual unit shear increment while maintaining
@@ -184,36 +175,19 @@ def compute_shear_stress_distribution(
 
     # Step 4: Compute Δq (shear flow rate) at each layer
     # Bentz Eq 6-9: Δq_i = j_i * (d_eps_x_i) + k_i * d_gamma_i
-    # where d_eps_x_i = d_eps0 - d_phi * dy_i
-    #       d_gamma_i = d_gamma0 * s(y_i)
-    for ld in layer_data:
-        dy = ld["dy"]
-        s = ld["s"]
-        d_eps_x = d_eps0 - d_phi * dy
-        d_gamma = d_gamma0 * s
-        ld["delta_q"] = ld["j"] * d_eps_x + ld["k_g"] * d_gamma
+    delta_q = j * (d_eps0 - d_phi * dy) + k_g * (d_gamma0 * s)
 
     # Step 5: Integrate Δq from top to get shear stress
     # q(y) = cumulative sum of Δq * thickness from top
     # tau(y) = q(y) / width(y)
-    results = []
-    q_cumulative = 0.0
-
-    # Integrate from top to bottom (reversed order)
-    for ld in reversed(layer_data):
-        lay = ld["lay"]
-        q_cumulative += ld["delta_q"] * lay.thickness
-        tau = q_cumulative / lay.width if lay.width > 0 else 0.0
-        results.append(ShearStressPoint(
-            y=lay.y_mid,
-            tau=tau,
-            delta_q=ld["delta_q"],
-        ))
-
-    # Reverse so results are bottom-to-top
-    results.reverse()
-
-    return results
+    q = np.cumsum((delta_q * section._t_c)[::-1])[::-1]
+    w = section._w_c
+    tau = np.divide(q, w, out=np.zeros(n), where=w > 0)
+
+    return [
+        ShearStressPoint(y=float(y_mid[i]), tau=float(tau[i]), delta_q=float(delta_q[i]))
+        for i in range(n)
+    ]
 
 
 def _solve_3x3(A: list, b: list):
@@ -21,6 +21,8 @@ import math
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
 from response_yolo.materials.concrete import Concrete
 from response_yolo.materials.steel import ReinforcingSteel
 
@@ -202,16 +204,14 @@ def solve_mcft_node(
     MCFTState
         Converged biaxial state including stresses and condensed tangent.
     """
-    # Special case: no shear → uniaxial
+    # Special case: no shear → uniaxial, no Newton iterations
     if abs(gamma_xy) < 1e-14:
-        sigma_cx = concrete.stress(eps_x)
+        sigma_cx, Et = concrete.stress_and_tangent(eps_x)
         fx_steel = 0.0
         if rho_x > 0 and long_material is not None:
-            fx_steel = rho_x * long_material.stress(eps_x)
-
-        Et = concrete.tangent(eps_x)
-        if rho_x > 0 and long_material is not None:
-            Et += rho_x * long_material.tangent(eps_x)
+            sig_s, Et_s = long_material.stress_and_tangent(eps_x)
+            fx_steel = rho_x * sig_s
+            Et += rho_x * Et_s
 
         return MCFTState(
             eps_x=eps_x, eps_y=0.0, gamma_xy=0.0,
@@ -312,6 +312,183 @@ def solve_mcft_node(
     )
 
 
+def _transverse_residual_vec(
+    eps_x: np.ndarray,
+    eps_y: np.ndarray,
+    gamma_xy: np.ndarray,
+    concrete: Concrete,
+    rho_y: np.ndarray,
+    stirrup_material: Optional[ReinforcingSteel],
+):
+    """Vectorized transverse residual for a batch of MCFT nodes.
+
+    Elementwise equivalent of :func:`_evaluate_transverse_residual` for
+    a single shared concrete (and optional stirrup) material.
+
+    Returns (sigma_y_total, sigma_cx, tau_cxy) as arrays.
+    """
+    # Mohr's circle compatibility
+    avg = 0.5 * (eps_x + eps_y)
+    diff = 0.5 * (eps_x - eps_y)
+    R = np.sqrt(diff * diff + (0.5 * gamma_xy) ** 2)
+    eps_1 = avg + R
+    eps_2 = avg - R
+
+    degenerate = (np.abs(eps_x - eps_y) < 1e-15) & (np.abs(gamma_xy) < 1e-15)
+    theta = np.where(degenerate, 0.0, 0.5 * np.arctan2(gamma_xy, eps_x - eps_y))
+
+    # Principal tensile stress (tension stiffening above cracking)
+    eps_1_pos = np.maximum(eps_1, 0.0)
+    fc1 = np.where(
+        eps_1 > 0.0,
+        np.where(
+            eps_1 <= concrete.ecr,
+            concrete.Ec * eps_1,
+            concrete.ft / (1.0 + np.sqrt(500.0 * eps_1_pos)),
+        ),
+        0.0,
+    )
+
+    # Principal compressive stress (softened where eps_2 < 0)
+    fc2 = np.empty_like(eps_2)
+    comp = eps_2 < 0.0
+    if comp.any():
+        fc2[comp] = -concrete.compression_stress_softened_vec(
+            -eps_2[comp], eps_1_pos[comp]
+        )
+    both_tens = ~comp
+    if both_tens.any():
+        e2 = eps_2[both_tens]
+        fc2[both_tens] = np.where(
+            e2 <= concrete.ecr,
+            concrete.Ec * e2,
+            concrete.ft / (1.0 + np.sqrt(500.0 * e2)),
+        )
+
+    # Transform to x-y via Mohr's circle
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+    c2 = cos_t * cos_t
+    s2 = sin_t * sin_t
+    cs = cos_t * sin_t
+
+    sigma_cx = fc1 * c2 + fc2 * s2
+    sigma_cy = fc1 * s2 + fc2 * c2
+    tau_cxy = (fc1 - fc2) * cs
+
+    sigma_y_total = sigma_cy
+    if stirrup_material is not None:
+        sigma_y_total = sigma_cy + rho_y * stirrup_material.stress_vec(eps_y)
+
+    return sigma_y_total, sigma_cx, tau_cxy
+
+
+def solve_mcft_node_batch(
+    eps_x: np.ndarray,
+    gamma_xy: np.ndarray,
+    concrete: Concrete,
+    rho_y: Optional[np.ndarray] = None,
+    stirrup_material: Optional[ReinforcingSteel] = None,
+    max_iter: int = 40,
+    tol: float = 1e-3,
+):
+    """Solve the MCFT equations for a batch of nodes in one call.
+
+    Vectorized counterpart of :func:`solve_mcft_node` for the common case
+    where every node shares one concrete material and (at most) one
+    stirrup material — e.g. all layers of a section.  The Newton
+    iteration on eps_y runs on whole arrays; converged lanes are frozen
+    with a boolean mask rather than exiting early.
+
+    Only the stresses are computed (no condensed tangents) — this is the
+    force-integration path.  Stiffness assembly still uses the scalar
+    solver, which provides the 2×2 tangent.
+
+    Parameters
+    ----------
+    eps_x : ndarray
+        Longitudinal strains, one per node.
+    gamma_xy : ndarray
+        Shear strains, one per node.
+    concrete : Concrete
+        Shared concrete material.
+    rho_y : ndarray, optional
+        Transverse reinforcement ratio per node (default: all zero).
+    stirrup_material : ReinforcingSteel or None
+        Shared stirrup material.
+    max_iter, tol :
+        Same meaning as in :func:`solve_mcft_node`.
+
+    Returns
+    -------
+    (sigma_x, tau_xy) : tuple of ndarray
+        Total longitudinal stress and shear stress per node.
+    """
+    eps_x = np.asarray(eps_x, dtype=np.float64)
+    gamma_xy = np.asarray(gamma_xy, dtype=np.float64)
+    if rho_y is None:
+        rho_y = np.zeros_like(eps_x)
+
+    sigma_x = np.empty_like(eps_x)
+    tau_xy = np.zeros_like(eps_x)
+
+    # Uniaxial lanes (no shear) — plain constitutive evaluation
+    uni = np.abs(gamma_xy) < 1e-14
+    if uni.any():
+        sigma_x[uni] = concrete.stress_vec(eps_x[uni])
+
+    bi = ~uni
+    if not bi.any():
+        return sigma_x, tau_xy
+
+    ex = eps_x[bi]
+    g = gamma_xy[bi]
+    ry = rho_y[bi]
+
+    eps_y = ex * 0.5
+
+    # Iterate on a compacted index set: converged lanes are retired so
+    # later iterations only pay for the (few) stubborn ones.
+    idx = np.arange(ex.shape[0])
+    for _it in range(max_iter):
+        res, _, _ = _transverse_residual_vec(
+            ex[idx], eps_y[idx], g[idx], concrete, ry[idx], stirrup_material
+        )
+        still = np.abs(res) >= tol
+        idx = idx[still]
+        if idx.size == 0:
+            break
+        res = res[still]
+        ey = eps_y[idx]
+
+        # Numerical derivative d(sigma_y)/d(eps_y) via finite difference
+        deps_y = np.maximum(np.abs(ey) * 1e-6, 1e-10)
+        res_plus, _, _ = _transverse_residual_vec(
+            ex[idx], ey + deps_y, g[idx], concrete, ry[idx], stirrup_material
+        )
+        d_res = (res_plus - res) / deps_y
+
+        # Flat-tangent lanes take a small bisection-style nudge; the rest
+        # take a clipped Newton step (same limits as the scalar solver).
+        flat = np.abs(d_res) < 1e-12
+        newton = -res / np.where(flat, 1.0, d_res)
+        delta = np.where(
+            flat,
+            np.where(res > 0.0, -0.001, 0.001),
+            np.clip(newton, -0.01, 0.01),
+        )
+        eps_y[idx] = np.clip(ey + delta, -0.05, 0.05)
+
+    # Final evaluation at the (per-lane) converged eps_y
+    _, sigma_cx, tau_cxy = _transverse_residual_vec(
+        ex, eps_y, g, concrete, ry, stirrup_material
+    )
+    sigma_x[bi] = sigma_cx
+    tau_xy[bi] = tau_cxy
+
+    return sigma_x, tau_xy
+
+
 def _solve_for_sigma_x_tau(
     eps_x: float,
     gamma_xy: float,
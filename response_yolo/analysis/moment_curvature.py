@@ -47,6 +47,8 @@ import math
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy as np
+
 from response_yolo.section.cross_section import CrossSection
 
 
@@ -68,46 +70,79 @@ class MPhiPoint:
 
 @dataclass
 class MPhiResult:
-    """Full moment-curvature analysis result."""
+    """Full moment-curvature analysis result.
+
+    The response is stored as parallel NumPy arrays (one entry per
+    curvature step) so post-processing — peaks, envelopes, unit
+    conversion — is vectorised. :attr:`points` materialises the
+    familiar list of :class:`MPhiPoint` objects lazily on first access.
+    """
 
-    points: List[MPhiPoint] = field(default_factory=list)
+    phi: np.ndarray = field(default_factory=lambda: np.empty(0))      # 1/mm
+    M: np.ndarray = field(default_factory=lambda: np.empty(0))        # N-mm
+    eps0: np.ndarray = field(default_factory=lambda: np.empty(0))     # strain at y_ref
+    neutral_axis_y: np.ndarray = field(default_factory=lambda: np.empty(0))  # mm
+    converged: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
     axial_load: float = 0.0  # applied axial load (N)
     y_ref: float = 0.0  # reference axis y
 
-    # Key points (indices into self.points)
+    # Key points (indices into the arrays)
     cracking_index: Optional[int] = None
     yield_index: Optional[int] = None
     ultimate_index: Optional[int] = None
     failure_reason: str = ""
 
+    _points_cache: Optional[List[MPhiPoint]] = field(
+        default=None, init=False, repr=False
+    )
+
+    @property
+    def points(self) -> List[MPhiPoint]:
+        """The response as a list of :class:`MPhiPoint` (built lazily)."""
+        if self._points_cache is None:
+            self._points_cache = [
+                MPhiPoint(
+                    curvature=float(p),
+                    moment=float(m),
+                    eps_0=float(e),
+                    neutral_axis_y=float(y),
+                    converged=bool(c),
+                )
+                for p, m, e, y, c in zip(
+                    self.phi, self.M, self.eps0,
+                    self.neutral_axis_y, self.converged,
+                )
+            ]
+        return self._points_cache
+
     @property
     def curvatures(self) -> List[float]:
-        return [p.curvature for p in self.points]
+        return self.phi.tolist()
 
     @property
     def moments(self) -> List[float]:
-        return [p.moment for p in self.points]
+        return self.M.tolist()
 
     @property
     def moments_kNm(self) -> List[float]:
-        return [p.moment_kNm for p in self.points]
+        return (self.M / 1.0e6).tolist()
 
     @property
     def cracking_moment(self) -> Optional[float]:
         if self.cracking_index is not None:
-            return self.points[self.cracking_index].moment
+            return float(self.M[self.cracking_index])
         return None
 
     @property
     def yield_moment(self) -> Optional[float]:
         if self.yield_index is not None:
-            return self.points[self.yield_index].moment
+            return float(self.M[self.yield_index])
         return None
 
     @property
     def ultimate_moment(self) -> Optional[float]:
         if self.ultimate_index is not None:
-            return self.points[self.ultimate_index].moment
+            return float(self.M[self.ultimate_index])
         return None
 
     def to_dict(self) -> dict:
@@ -118,7 +153,8 @@ class MPhiResult:
         - moment: kNm (raw N·mm ÷ 1e6)
         - axial_strain: mm/m (raw × 1e3)
         """
-        converged_pts = [p for p in self.points if p.converged]
+        conv = self.converged
+        moments_kNm = (self.M[conv] / 1e6).tolist()
         return {
             "control_curves": {
                 "moment_curvature": {
@@ -127,11 +163,12 @@ class MPhiResult:
                     "y_axis": "moment",
                     "data": [
                         {
-                            "curvature": p.curvature * 1e6,   # mrad/m
-                            "moment": p.moment / 1e6,         # kNm
+                            "curvature": c,   # mrad/m
+                            "moment": m,      # kNm
                         }
-                        for p in self.points
-                        if p.converged
+                        for c, m in zip(
+                            (self.phi[conv] * 1e6).tolist(), moments_kNm
+                        )
                     ],
                 },
                 "moment_axial_strain": {
@@ -140,11 +177,12 @@ class MPhiResult:
                     "y_axis": "moment",
                     "data": [
                         {
-                            "axial_strain": p.eps_0 * 1e3,    # mm/m
-                            "moment": p.moment / 1e6,         # kNm
+                            "axial_strain": e,   # mm/m
+                            "moment": m,         # kNm
                         }
-                        for p in self.points
-                        if p.converged
+                        for e, m in zip(
+                            (self.eps0[conv] * 1e3).tolist(), moments_kNm
+                        )
                     ],
                 },
             },
@@ -159,21 +197,27 @@ class MPhiResult:
                     "mode": self.failure_reason or None,
                 },
                 "convergence": {
-                    "total_points": len(self.points),
-                    "converged_points": len(converged_pts),
+                    "total_points": len(self.phi),
+                    "converged_points": int(np.count_nonzero(conv)),
                 },
             },
             "response": [
                 {
-                    "curvature_1_per_mm": p.curvature,
-                    "curvature_1_per_m": p.curvature * 1000.0,
-                    "moment_Nmm": p.moment,
-                    "moment_kNm": p.moment_kNm,
-                    "eps_0": p.eps_0,
-                    "neutral_axis_y_mm": p.neutral_axis_y,
-                    "converged": p.converged,
+                    "curvature_1_per_mm": p,
+                    "curvature_1_per_m": p * 1000.0,
+                    "moment_Nmm": m,
+                    "moment_kNm": m / 1.0e6,
+                    "eps_0": e,
+                    "neutral_axis_y_mm": y,
+                    "converged": c,
                 }
-                for p in self.points
+                for p, m, e, y, c in zip(
+                    self.phi.tolist(),
+                    self.M.tolist(),
+                    self.eps0.tolist(),
+                    self.neutral_axis_y.tolist(),
+                    self.converged.tolist(),
+                )
             ],
         }
 
@@ -241,7 +285,16 @@ class MomentCurvatureAnalysis:
         MPhiResult
             The complete M-phi response.
         """
-        result = MPhiResult(axial_load=self.axial_load, y_ref=self.y_ref)
+        # Per-step accumulators — converted to the result arrays at the end
+        phi_l: List[float] = []
+        M_l: List[float] = []
+        eps0_l: List[float] = []
+        na_l: List[float] = []
+        conv_l: List[bool] = []
+        cracking_index: Optional[int] = None
+        yield_index: Optional[int] = None
+        ultimate_index: Optional[int] = None
+        failure_reason = ""
 
         # Build curvature vector
         if self.curvature_step is not None:
@@ -251,29 +304,82 @@ class MomentCurvatureAnalysis:
             dphi = self.max_curvature / self.n_steps
             phis = [i * dphi for i in range(1, self.n_steps + 1)]
 
+        # y_ref is fixed for the whole run — freeze the dy arrays once
+        prepared = self.section.prepare(self.y_ref)
+
         eps_0 = 0.0  # initial guess for centroidal strain
         prev_cracked = False
         prev_yielded = False
 
+        # Tangent state of the last converged step, for the predictor
+        EA_last: Optional[float] = None
+        ES_last = 0.0
+        N_last = 0.0
+
         for phi in phis:
-            # Newton-Raphson to find eps_0 that satisfies N = N_applied
+            # Predictor. Preferred: tangent-based — with ES = dN/dphi,
+            # linearising N(eps_0, phi) about the last converged step
+            # gives
+            #   d(eps_0) = (N_applied - N - ES*dphi) / EA,
+            # which is exact while the section response stays linear
+            # (pre-cracking), so those steps converge on the single
+            # verification integration. Fallback: secant extrapolation
+            # from the last two converged steps.
+            if conv_l and conv_l[-1] and EA_last is not None and abs(EA_last) > 1e-6:
+                dphi_step = phi - phi_l[-1]
+                eps_0 = eps0_l[-1] + (
+                    self.axial_load - N_last - ES_last * dphi_step
+                ) / EA_last
+            elif len(phi_l) >= 2 and conv_l[-1] and conv_l[-2]:
+                dphi_prev = phi_l[-1] - phi_l[-2]
+                if dphi_prev > 0.0:
+                    slope = (eps0_l[-1] - eps0_l[-2]) / dphi_prev
+                    eps_0 = eps0_l[-1] + slope * (phi - phi_l[-1])
+
+            # Newton-Raphson to find eps_0 that satisfies N = N_applied.
+            # Forces and tangent come from one fused section traversal.
+            # A full Newton step that grows the residual (softening or a
+            # cracking transition) is halved until it strictly reduces
+            # it — damped Newton, no extra integration per good step.
             converged = False
+            N, M = 0.0, 0.0
+            prev_eps = eps_0
+            prev_residual: Optional[float] = None
+            step = 0.0
+            backtracks = 0
             for iteration in range(self.max_iter):
-                N, M = self.section.integrate_forces(eps_0, phi, self.y_ref)
+                N, M, EA, ES, EI = prepared.integrate_forces_and_stiffness(eps_0, phi)
                 residual = N - self.axial_load
 
                 if abs(residual) < self.tol_force:
                     converged = True
                     break
 
-                EA, ES, EI = self.section.integrate_stiffness(eps_0, phi, self.y_ref)
+                if (
+                    prev_residual is not None
+                    and abs(residual) >= abs(prev_residual)
+                    and backtracks < 8
+                ):
+                    step *= 0.5
+                    eps_0 = prev_eps + step
+                    backtracks += 1
+                    continue
+
                 if abs(EA) < 1e-6:
                     # Section has lost all stiffness — failure
                     break
-                eps_0 -= residual / EA
-
-            # Re-compute final forces
-            N, M = self.section.integrate_forces(eps_0, phi, self.y_ref)
+                prev_eps = eps_0
+                prev_residual = residual
+                backtracks = 0
+                step = -residual / EA
+                eps_0 += step
+
+            if converged:
+                EA_last, ES_last, N_last = EA, ES, N
+            else:
+                EA_last = None
+                # eps_0 moved after the last evaluation — refresh forces
+                N, M = prepared.integrate_forces(eps_0, phi)
 
             # Compute neutral axis location
             # eps(y) = eps_0 - phi*(y - y_ref) = 0  =>  y = y_ref + eps_0/phi
@@ -282,86 +388,105 @@ class MomentCurvatureAnalysis:
             else:
                 na_y = float('inf')
 
-            point = MPhiPoint(
-                curvature=phi,
-                moment=M,
-                eps_0=eps_0,
-                neutral_axis_y=na_y,
-                converged=converged,
-            )
-            result.points.append(point)
+            phi_l.append(phi)
+            M_l.append(M)
+            eps0_l.append(eps_0)
+            na_l.append(na_y)
+            conv_l.append(converged)
+            i_point = len(phi_l) - 1
 
             # --- Detect key events ---
 
             # Cracking detection
-            if result.cracking_index is None and not prev_cracked:
-                cracked = self._check_cracking(eps_0, phi)
+            if cracking_index is None and not prev_cracked:
+                cracked = self._check_cracking(prepared, eps_0, phi)
                 if cracked:
-                    result.cracking_index = len(result.points) - 1
+                    cracking_index = i_point
                     prev_cracked = True
 
             # Yield detection
-            if result.yield_index is None and not prev_yielded:
-                yielded = self._check_yield(eps_0, phi)
+            if yield_index is None and not prev_yielded:
+                yielded = self._check_yield(prepared, eps_0, phi)
                 if yielded:
-                    result.yield_index = len(result.points) - 1
+                    yield_index = i_point
                     prev_yielded = True
 
             # Failure detection
-            failure = self._check_failure(eps_0, phi)
+            failure = self._check_failure(prepared, eps_0, phi)
             if failure:
-                result.ultimate_index = len(result.points) - 1
-                result.failure_reason = failure
+                ultimate_index = i_point
+                failure_reason = failure
                 break
 
             if not converged:
-                result.ultimate_index = len(result.points) - 1
-                result.failure_reason = "convergence_failure"
+                ultimate_index = i_point
+                failure_reason = "convergence_failure"
                 break
 
         # If we reached max curvature without failure, ultimate = last point
-        if result.ultimate_index is None and result.points:
-            result.ultimate_index = len(result.points) - 1
-
-        return result
+        if ultimate_index is None and phi_l:
+            ultimate_index = len(phi_l) - 1
+
+        return MPhiResult(
+            phi=np.asarray(phi_l),
+            M=np.asarray(M_l),
+            eps0=np.asarray(eps0_l),
+            neutral_axis_y=np.asarray(na_l),
+            converged=np.asarray(conv_l, dtype=bool),
+            axial_load=self.axial_load,
+            y_ref=self.y_ref,
+            cracking_index=cracking_index,
+            yield_index=yield_index,
+            ultimate_index=ultimate_index,
+            failure_reason=failure_reason,
+        )
 
     # ------------------------------------------------------------------
     # Event detection helpers
     # ------------------------------------------------------------------
-    def _check_cracking(self, eps_0: float, phi: float) -> bool:
+    def _check_cracking(self, prepared, eps_0: float, phi: float) -> bool:
         """Check if any concrete layer has cracked (tensile strain > ecr)."""
-        for lay in self.section.concrete_layers:
-            eps = eps_0 - phi * (lay.y_mid - self.y_ref)
-            if eps > lay.material.ecr:
-                return True
-        return False
-
-    def _check_yield(self, eps_0: float, phi: float) -> bool:
+        sec = self.section
+        if not sec.concrete_layers:
+            return False
+        eps = eps_0 - phi * prepared._dy_c
+        return any(
+            bool(np.any(eps[idx] > mat.ecr)) for mat, idx in sec._conc_groups
+        )
+
+    def _check_yield(self, prepared, eps_0: float, phi: float) -> bool:
         """Check if any rebar has yielded."""
-        for bar in self.section.rebars:
-            eps = eps_0 - phi * (bar.y - self.y_ref)
-            if abs(eps) >= bar.material.ey:
-                return True
-        return False
-
-    def _check_failure(self, eps_0: float, phi: float) -> str:
+        sec = self.section
+        if not sec.rebars:
+            return False
+        eps = np.abs(eps_0 - phi * prepared._dy_r)
+        return any(
+            bool(np.any(eps[idx] >= mat.ey)) for mat, idx in sec._rebar_groups
+        )
+
+    def _check_failure(self, prepared, eps_0: float, phi: float) -> str:
         """Check failure criteria. Returns failure reason or empty string."""
+        sec = self.section
+
         # Concrete crushing
-        for lay in self.section.concrete_layers:
-            eps = eps_0 - phi * (lay.y_mid - self.y_ref)
-            if eps < -lay.material.ecu:
-                return "concrete_crushing"
+        if sec.concrete_layers:
+            eps = eps_0 - phi * prepared._dy_c
+            for mat, idx in sec._conc_groups:
+                if np.any(eps[idx] < -mat.ecu):
+                    return "concrete_crushing"
 
         # Rebar fracture
-        for bar in self.section.rebars:
-            eps = eps_0 - phi * (bar.y - self.y_ref)
-            if abs(eps) >= bar.material.esu:
-                return "rebar_fracture"
+        if sec.rebars:
+            eps = np.abs(eps_0 - phi * prepared._dy_r)
+            for mat, idx in sec._rebar_groups:
+                if np.any(eps[idx] >= mat.esu):
+                    return "rebar_fracture"
 
         # Tendon rupture
-        for t in self.section.tendons:
-            eps = eps_0 - phi * (t.y - self.y_ref) + t.prestrain
-            if eps >= t.material.epu:
-                return "tendon_rupture"
+        if sec.tendons:
+            eps = eps_0 - phi * prepared._dy_t + sec._pre_t
+            for mat, idx in sec._tendon_groups:
+                if np.any(eps[idx] >= mat.epu):
+                    return "tendon_rupture"
 
         return ""
@@ -46,11 +46,27 @@ Output JSON schema:
 
 from __future__ import annotations
 
+import copy
 import json
 import math
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+# orjson (C-implemented, SIMD-accelerated) is used when available; the
+# stdlib json module is the fallback.  Both produce/accept the same JSON.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# msgspec provides typed Struct schemas for the output envelope plus a
+# C-implemented encoder; preferred over orjson for serialisation.
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
 from response_yolo.materials.concrete import Concrete, CompressionModel, TensionModel
 from response_yolo.materials.steel import ReinforcingSteel, SteelModel
 from response_yolo.materials.prestressing import PrestressingSteel, PrestressModel
@@ -69,10 +85,22 @@ def load_json_input(filepath: str | Path) -> Dict[str, Any]:
 
     Returns dict with same structure as parse_r2t():
       "section", "analysis_type", "analysis_params", "loading", "units", "metadata"
+
+    Repeated loads of the same unchanged file (parameter sweeps, batch
+    CLI runs) are served from an mtime-keyed cache; callers get a deep
+    copy, so mutating the returned section never pollutes the cache.
     """
     filepath = Path(filepath)
-    with open(filepath) as f:
-        data = json.load(f)
+    mtime = filepath.stat().st_mtime
+    return copy.deepcopy(_load_cached(str(filepath), mtime))
+
+
+@lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime: float) -> Dict[str, Any]:
+    """Parse and build the configuration once per (path, mtime)."""
+    filepath = Path(path_str)
+    raw = filepath.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     # Parse concrete
     cd = data.get("concrete", {})
@@ -184,6 +212,43 @@ def load_json_input(filepath: str | Path) -> Dict[str, Any]:
     }
 
 
+if msgspec is not None:
+
+    class _InputSource(msgspec.Struct):
+        """Provenance of the analysed input file."""
+
+        format: str
+        file: str
+
+    class _Metadata(msgspec.Struct, omit_defaults=True):
+        """Envelope metadata block (output spec v1.0.0)."""
+
+        version: str
+        timestamp: str
+        generator: str
+        analysis_type: str
+        input_source: _InputSource
+        computation_time: float | None = None
+
+    class _Units(msgspec.Struct):
+        """Fixed unit system of all result quantities."""
+
+        length: str = "mm"
+        force: str = "kN"
+        stress: str = "MPa"
+        moment: str = "kNm"
+        strain: str = "mm/m"
+        curvature: str = "mrad/m"
+
+    class _Envelope(msgspec.Struct):
+        """Top-level output document."""
+
+        metadata: _Metadata
+        units: _Units
+        section_properties: Dict[str, Any]
+        results: Dict[str, Any]
+
+
 def save_json_output(
     result_dict: Dict[str, Any],
     filepath: str | Path,
@@ -205,10 +270,31 @@ def save_json_output(
     if input_file.endswith(".r2t"):
         input_format = "r2t"
 
+    timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    filepath = Path(filepath)
+
+    if msgspec is not None:
+        envelope = _Envelope(
+            metadata=_Metadata(
+                version="1.0.0",
+                timestamp=timestamp,
+                generator=f"response-yolo v{__version__}",
+                analysis_type=analysis_type,
+                input_source=_InputSource(format=input_format, file=input_file),
+                computation_time=computation_time,
+            ),
+            units=_Units(),
+            section_properties=section_props or {},
+            results=result_dict,
+        )
+        buf = msgspec.json.encode(envelope, enc_hook=_json_default)
+        filepath.write_bytes(msgspec.json.format(buf, indent=2))
+        return
+
     output = {
         "metadata": {
             "version": "1.0.0",
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "timestamp": timestamp,
             "generator": f"response-yolo v{__version__}",
             "analysis_type": analysis_type,
             "input_source": {
@@ -231,9 +317,13 @@ def save_json_output(
     if computation_time is not None:
         output["metadata"]["computation_time"] = computation_time
 
-    filepath = Path(filepath)
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2, default=_json_default)
+    if orjson is not None:
+        filepath.write_bytes(
+            orjson.dumps(output, option=orjson.OPT_INDENT_2, default=_json_default)
+        )
+    else:
+        with open(filepath, "w") as f:
+            json.dump(output, f, indent=2, default=_json_default)
 
 
 def _json_default(obj):
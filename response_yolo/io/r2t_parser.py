@@ -27,11 +27,14 @@ produce warnings rather than errors.
 
 from __future__ import annotations
 
-import re
+import io
+import math
 import warnings
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
+
 from response_yolo.materials.concrete import Concrete, CompressionModel, TensionModel
 from response_yolo.materials.steel import ReinforcingSteel, SteelModel
 from response_yolo.materials.prestressing import PrestressingSteel, PrestressModel
@@ -67,11 +70,10 @@ def parse_r2t(filepath: str | Path) -> Dict[str, Any]:
 
     for line in lines:
         stripped = line.strip()
-        if not stripped or stripped.startswith("#") or stripped.startswith(";"):
+        if not stripped or stripped[0] in "#;":
             continue
-        m = re.match(r"^\[(.+)\]$", stripped)
-        if m:
-            current_section = m.group(1).upper()
+        if stripped[0] == "[" and stripped[-1] == "]" and len(stripped) > 2:
+            current_section = stripped[1:-1].upper()
             sections.setdefault(current_section, [])
         else:
             sections.setdefault(current_section, []).append(stripped)
@@ -130,18 +132,39 @@ def parse_r2t(filepath: str | Path) -> Dict[str, Any]:
     }
 
 
-def _parse_concrete(lines: list) -> Concrete:
-    """Parse [CONCRETE] section."""
+_KV_DELIMS = "=, \t"
+
+
+def _split_kv(line: str) -> Tuple[str, Optional[str]]:
+    """Split 'key = value' / 'key, value' / 'key value' into (key, rest).
+
+    Regex-free replacement for re.split(r"[=,\\s]+", line, maxsplit=1):
+    scans to the first delimiter, then strips the delimiter run.
+    Returns (line, None) if the line has no delimiter.
+    """
+    for i, ch in enumerate(line):
+        if ch in _KV_DELIMS:
+            return line[:i], line[i:].lstrip(_KV_DELIMS)
+    return line, None
+
+
+def _parse_props(lines: list) -> Dict[str, float]:
+    """Parse key/value lines into a lower-cased float property dict."""
     props: Dict[str, float] = {}
     for line in lines:
-        parts = re.split(r"[=,\s]+", line, maxsplit=1)
-        if len(parts) == 2:
-            key = parts[0].strip().lower()
-            try:
-                val = float(parts[1].strip())
-            except ValueError:
-                continue
-            props[key] = val
+        key, rest = _split_kv(line)
+        if rest is None:
+            continue
+        try:
+            props[key.strip().lower()] = float(rest.strip())
+        except ValueError:
+            continue
+    return props
+
+
+def _parse_concrete(lines: list) -> Concrete:
+    """Parse [CONCRETE] section."""
+    props = _parse_props(lines)
 
     fc = props.get("fc", props.get("f'c", props.get("fpc", 30.0)))
     return Concrete(
@@ -166,14 +189,12 @@ def _parse_section_geometry(lines: list):
         elif "tee" in low or "t-section" in low:
             shape_type = "tee"
 
-        parts = re.split(r"[=,\s]+", line, maxsplit=1)
-        if len(parts) == 2:
-            key = parts[0].strip().lower()
+        key, rest = _split_kv(line)
+        if rest is not None:
             try:
-                val = float(parts[1].strip())
+                props[key.strip().lower()] = float(rest.strip())
             except ValueError:
                 continue
-            props[key] = val
 
     if shape_type == "circular":
         return CircularSection(diameter=props.get("d", props.get("diameter", 500)))
@@ -193,16 +214,7 @@ def _parse_section_geometry(lines: list):
 
 def _parse_steel(lines: list) -> ReinforcingSteel:
     """Parse [LONG STEEL] section."""
-    props: Dict[str, float] = {}
-    for line in lines:
-        parts = re.split(r"[=,\s]+", line, maxsplit=1)
-        if len(parts) == 2:
-            key = parts[0].strip().lower()
-            try:
-                val = float(parts[1].strip())
-            except ValueError:
-                continue
-            props[key] = val
+    props = _parse_props(lines)
 
     return ReinforcingSteel(
         fy=props.get("fy", 400.0),
@@ -218,17 +230,21 @@ def _parse_rebars(lines: list, default_steel: ReinforcingSteel) -> list:
 
     Expected format per line:  y_mm  area_mm2  [fy]
     or:  y_mm  n_bars  diameter_mm
+
+    Uniform blocks (every line the same column count) are tokenised in a
+    single np.loadtxt call — one C pass instead of float() per token,
+    which matters for files with thousands of bar lines.  Ragged or
+    partly invalid blocks fall back to the per-line loop.
     """
-    bars = []
-    for line in lines:
-        parts = line.split()
-        if len(parts) < 2:
-            continue
-        try:
-            vals = [float(p) for p in parts]
-        except ValueError:
-            continue
+    if not lines:
+        return []
+
+    rows = _load_numeric_block(lines)
+    if rows is None:
+        rows = _numeric_rows_slow(lines)
 
+    bars = []
+    for vals in rows:
         if len(vals) == 2:
             bars.append(RebarBar(y=vals[0], area=vals[1], material=default_steel))
         elif len(vals) >= 3:
@@ -239,7 +255,6 @@ def _parse_rebars(lines: list, default_steel: ReinforcingSteel) -> list:
                                        fu=default_steel.fu, esu=default_steel.esu)
                 bars.append(RebarBar(y=vals[0], area=vals[1], material=mat))
             else:
-                import math
                 n_bars = int(vals[1])
                 dia = vals[2]
                 area = n_bars * math.pi / 4 * dia ** 2
@@ -248,6 +263,36 @@ def _parse_rebars(lines: list, default_steel: ReinforcingSteel) -> list:
     return bars
 
 
+def _load_numeric_block(lines: list) -> Optional[list]:
+    """Tokenise a block of whitespace-delimited numeric lines in one pass.
+
+    Returns a list of per-line float lists, or None if the block is
+    ragged or contains non-numeric tokens (caller falls back to the
+    per-line loop).
+    """
+    try:
+        arr = np.loadtxt(io.StringIO("\n".join(lines)), dtype=np.float64, ndmin=2)
+    except ValueError:
+        return None
+    if arr.shape[1] < 2 or arr.shape[0] != len(lines):
+        return None
+    return arr.tolist()
+
+
+def _numeric_rows_slow(lines: list) -> list:
+    """Per-line fallback tokeniser: skips short or non-numeric lines."""
+    rows = []
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        try:
+            rows.append([float(p) for p in parts])
+        except ValueError:
+            continue
+    return rows
+
+
 def _parse_tendons(lines: list, all_sections: dict) -> list:
     """Parse [TENDON] section."""
     tendons = []
@@ -272,16 +317,7 @@ def _parse_tendons(lines: list, all_sections: dict) -> list:
 
 
 def _parse_prestressing_steel(lines: list) -> PrestressingSteel:
-    props: Dict[str, float] = {}
-    for line in lines:
-        parts = re.split(r"[=,\s]+", line, maxsplit=1)
-        if len(parts) == 2:
-            key = parts[0].strip().lower()
-            try:
-                val = float(parts[1].strip())
-            except ValueError:
-                continue
-            props[key] = val
+    props = _parse_props(lines)
 
     return PrestressingSteel(
         fpu=props.get("fpu", 1860.0),
@@ -310,16 +346,7 @@ def _parse_trans_steel(
     if not lines:
         return None
 
-    props: Dict[str, float] = {}
-    for line in lines:
-        parts = re.split(r"[=,\s]+", line, maxsplit=1)
-        if len(parts) == 2:
-            key = parts[0].strip().lower()
-            try:
-                val = float(parts[1].strip())
-            except ValueError:
-                continue
-            props[key] = val
+    props = _parse_props(lines)
 
     if "av" not in props or "s" not in props:
         warnings.warn(
@@ -341,16 +368,7 @@ def _parse_trans_steel(
 
 
 def _parse_loading(lines: list) -> Dict[str, float]:
-    props: Dict[str, float] = {}
-    for line in lines:
-        parts = re.split(r"[=,\s]+", line, maxsplit=1)
-        if len(parts) == 2:
-            key = parts[0].strip().lower()
-            try:
-                val = float(parts[1].strip())
-            except ValueError:
-                continue
-            props[key] = val
+    props = _parse_props(lines)
     return {
         "N": props.get("n", props.get("axial", 0.0)),
         "M": props.get("m", props.get("moment", 0.0)),
@@ -373,16 +391,16 @@ def _parse_analysis(lines: list) -> Dict[str, Any]:
         elif "interaction" in low:
             params["type"] = "moment_shear_interaction"
 
-        parts = re.split(r"[=,\s]+", line, maxsplit=1)
-        if len(parts) == 2:
-            key = parts[0].strip().lower()
+        key, rest = _split_kv(line)
+        if rest is not None:
+            rest = rest.strip()
             try:
-                val = float(parts[1].strip())
+                val = float(rest)
                 if val == int(val):
                     val = int(val)
             except ValueError:
-                val = parts[1].strip()
-            params[key] = val
+                val = rest
+            params[key.strip().lower()] = val
 
     params.setdefault("type", "moment_curvature")
     return params
@@ -25,6 +25,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
+import numpy as np
+
 
 class CompressionModel(Enum):
     HOGNESTAD = "hognestad"
@@ -38,7 +40,7 @@ class TensionModel(Enum):
     NO_TENSION = "no_tension"
 
 
-@dataclass
+@dataclass(slots=True)
 class Concrete:
     """Concrete material following Response-2000 constitutive relationships.
 
@@ -80,6 +82,9 @@ class Concrete:
     # Derived quantities (computed in __post_init__)
     _n: float = field(init=False, repr=False, default=0.0)
     _k: float = field(init=False, repr=False, default=0.0)
+    # Cracking strain ft/Ec — cached here so the hot paths read a plain
+    # attribute instead of going through a property per evaluation.
+    ecr: float = field(init=False, repr=False, default=0.0)
 
     def __post_init__(self) -> None:
         if self.fc <= 0:
@@ -103,10 +108,7 @@ class Concrete:
         else:
             self._k = 0.67 + self.fc / 62.0
 
-    @property
-    def ecr(self) -> float:
-        """Cracking strain."""
-        return self.ft / self.Ec
+        self.ecr = self.ft / self.Ec
 
     def stress(self, strain: float) -> float:
         """Return stress (MPa) for a given strain.
@@ -130,6 +132,101 @@ class Concrete:
         s2 = self.stress(strain + ds)
         return (s2 - s1) / (2.0 * ds)
 
+    def stress_and_tangent(self, strain: float) -> tuple:
+        """Return (stress, tangent) at the given strain in one call."""
+        ds = 1.0e-8
+        s1 = self.stress(strain - ds)
+        s2 = self.stress(strain + ds)
+        return self.stress(strain), (s2 - s1) / (2.0 * ds)
+
+    # ------------------------------------------------------------------
+    # Vectorized evaluation (NumPy) — used by the layered SoA hot path
+    # ------------------------------------------------------------------
+    def stress_vec(self, strain: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`stress` for an array of strains.
+
+        Elementwise identical to the scalar version: compression is
+        negative, tension positive, crushed layers (strain < -ecu)
+        return zero.
+        """
+        strain = np.asarray(strain, dtype=np.float64)
+        out = np.zeros_like(strain)
+
+        comp = (strain < 0.0) & (strain >= -self.ecu)
+        if comp.any():
+            out[comp] = self._compression_stress_vec(-strain[comp])
+
+        tens = strain > 0.0
+        if tens.any():
+            out[tens] = self._tension_stress_vec(strain[tens])
+
+        return out
+
+    def tangent_vec(self, strain: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`tangent` (central difference)."""
+        strain = np.asarray(strain, dtype=np.float64)
+        ds = 1.0e-8
+        return (self.stress_vec(strain + ds) - self.stress_vec(strain - ds)) / (2.0 * ds)
+
+    def stress_and_tangent_vec(self, strain: np.ndarray) -> tuple:
+        """Vectorized :meth:`stress_and_tangent`.
+
+        The centre and the two central-difference evaluations are stacked
+        into a single stress_vec call, so the piecewise-region masks are
+        built once over 3n elements instead of three times over n.
+        """
+        strain = np.asarray(strain, dtype=np.float64)
+        ds = 1.0e-8
+        n = strain.shape[0]
+        stacked = np.concatenate((strain, strain + ds, strain - ds))
+        s = self.stress_vec(stacked)
+        return s[:n], (s[n:2 * n] - s[2 * n:]) / (2.0 * ds)
+
+    def _compression_stress_vec(self, eps: np.ndarray) -> np.ndarray:
+        """Vectorized compression backbone (input: positive magnitudes)."""
+        if self.compression_model == CompressionModel.POPOVICS:
+            return -self._popovics_vec(eps)
+        elif self.compression_model == CompressionModel.HOGNESTAD:
+            return -self._hognestad_vec(eps)
+        elif self.compression_model == CompressionModel.COLLINS_MITCHELL:
+            return -self._collins_mitchell_vec(eps)
+        raise ValueError(f"Unknown compression model: {self.compression_model}")
+
+    def _popovics_vec(self, eps: np.ndarray) -> np.ndarray:
+        n = self._n
+        ratio = eps / self.ec
+        k = np.where(ratio <= 1.0, 1.0, self._k)
+        denom = n - 1.0 + ratio ** (n * k)
+        safe = denom > 0.0
+        return np.where(safe, self.fc * ratio * n / np.where(safe, denom, 1.0), 0.0)
+
+    def _hognestad_vec(self, eps: np.ndarray) -> np.ndarray:
+        ratio = eps / self.ec
+        pre_peak = self.fc * (2.0 * ratio - ratio * ratio)
+        slope = 0.15 * self.fc / (self.ecu - self.ec)
+        post_peak = np.maximum(0.0, self.fc - slope * (eps - self.ec))
+        return np.where(ratio <= 1.0, pre_peak, post_peak)
+
+    def _collins_mitchell_vec(self, eps: np.ndarray) -> np.ndarray:
+        n = self._n
+        ratio = eps / self.ec
+        denom = n - 1.0 + ratio ** n
+        safe = denom > 0.0
+        return np.where(safe, self.fc * ratio * n / np.where(safe, denom, 1.0), 0.0)
+
+    def _tension_stress_vec(self, eps: np.ndarray) -> np.ndarray:
+        """Vectorized tension model (input: positive strains)."""
+        if self.tension_model == TensionModel.NO_TENSION:
+            return np.zeros_like(eps)
+
+        elastic = self.Ec * eps
+        if self.tension_model == TensionModel.MCFT:
+            cracked = self.ft / (1.0 + np.sqrt(500.0 * eps))
+        else:
+            # LINEAR_CUTOFF: immediate drop after cracking
+            cracked = np.zeros_like(eps)
+        return np.where(eps <= self.ecr, elastic, cracked)
+
     # ------------------------------------------------------------------
     # Compression backbone (strain input is positive magnitude)
     # ------------------------------------------------------------------
@@ -246,6 +343,27 @@ class Concrete:
 
         return beta * base
 
+    def compression_stress_softened_vec(
+        self, eps_magnitude: np.ndarray, eps_1: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized :meth:`compression_stress_softened`.
+
+        Same Vecchio & Collins softening, evaluated elementwise on arrays
+        of compressive strain magnitudes and principal tensile strains.
+        """
+        beta = 1.0 / (0.8 + 170.0 * np.maximum(eps_1, 0.0))
+        beta = np.clip(beta, 0.15, 1.0)
+
+        eps_eff = eps_magnitude / beta
+        if self.compression_model == CompressionModel.HOGNESTAD:
+            base = self._hognestad_vec(eps_eff)
+        elif self.compression_model == CompressionModel.COLLINS_MITCHELL:
+            base = self._collins_mitchell_vec(eps_eff)
+        else:
+            base = self._popovics_vec(eps_eff)
+
+        return beta * base
+
     def _mcft_tension(self, eps: float) -> float:
         """MCFT tension stiffening: f_t = f_cr / (1 + sqrt(500 * eps)).
 
@@ -17,6 +17,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
+import numpy as np
+
 
 class PrestressModel(Enum):
     POWER_FORMULA = "power_formula"
@@ -50,6 +52,9 @@ class PrestressingSteel:
     # Power-formula parameters (derived)
     _N: float = 0.0
     _k: float = 0.0
+    # Reciprocals precomputed for the Newton loop in _power_formula
+    _inv_Ep: float = 0.0
+    _inv_fpu: float = 0.0
 
     def __post_init__(self) -> None:
         if self.fpu <= 0:
@@ -57,17 +62,23 @@ class PrestressingSteel:
         if self.fpy is None:
             self.fpy = 0.9 * self.fpu
 
+        self._inv_Ep = 1.0 / self.Ep
+        self._inv_fpu = 1.0 / self.fpu
+
         # Fit power formula: eps = f/Ep + k*(f/fpu)^N
         # At yield point: epy = fpy/Ep + 0.001 (0.1% offset definition)
         # So k*(fpy/fpu)^N = 0.001
         # At ultimate: epu = fpu/Ep + k  (since (fpu/fpu)^N = 1)
         # So k = epu - fpu/Ep
-        self._k = self.epu - self.fpu / self.Ep
+        self._k = self.epu - self.fpu * self._inv_Ep
         if self._k > 0 and self.fpy < self.fpu:
-            ratio = self.fpy / self.fpu
+            ratio = self.fpy * self._inv_fpu
             target = 0.001  # 0.1% offset
             if ratio > 0 and ratio < 1 and target < self._k:
-                self._N = math.log(target / self._k) / math.log(ratio)
+                # log(target/k)/log(ratio) with a single division:
+                # (log(target) - log(k)) * 1/log(ratio)
+                log_ratio_inv = 1.0 / math.log(ratio)
+                self._N = (math.log(target) - math.log(self._k)) * log_ratio_inv
             else:
                 self._N = 7.0  # fallback
         else:
@@ -92,6 +103,62 @@ class PrestressingSteel:
         ds = 1.0e-8
         return (self.stress(strain + ds) - self.stress(strain - ds)) / (2.0 * ds)
 
+    def stress_and_tangent(self, strain: float) -> tuple:
+        """Return (stress, tangent) at the given strain in one call."""
+        ds = 1.0e-8
+        s1 = self.stress(strain - ds)
+        s2 = self.stress(strain + ds)
+        return self.stress(strain), (s2 - s1) / (2.0 * ds)
+
+    # ------------------------------------------------------------------
+    # Vectorized evaluation (NumPy) — used by the SoA tendon path
+    # ------------------------------------------------------------------
+    def stress_vec(self, strain: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`stress` for an array of strains."""
+        strain = np.asarray(strain, dtype=np.float64)
+        out = np.zeros_like(strain)
+        valid = (strain > 0.0) & (strain < self.epu)
+        if valid.any():
+            eps = strain[valid]
+            if self.model == PrestressModel.BILINEAR:
+                out[valid] = self._bilinear_vec(eps)
+            else:
+                out[valid] = self._power_formula_vec(eps)
+        return out
+
+    def tangent_vec(self, strain: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`tangent` (central difference)."""
+        strain = np.asarray(strain, dtype=np.float64)
+        ds = 1.0e-8
+        return (self.stress_vec(strain + ds) - self.stress_vec(strain - ds)) / (2.0 * ds)
+
+    def stress_and_tangent_vec(self, strain: np.ndarray) -> tuple:
+        """Vectorized :meth:`stress_and_tangent` via one stacked call."""
+        strain = np.asarray(strain, dtype=np.float64)
+        ds = 1.0e-8
+        n = strain.shape[0]
+        s = self.stress_vec(np.concatenate((strain, strain + ds, strain - ds)))
+        return s[:n], (s[n:2 * n] - s[2 * n:]) / (2.0 * ds)
+
+    def _power_formula_vec(self, eps: np.ndarray) -> np.ndarray:
+        """Vectorized inverse Ramberg-Osgood (Newton on the whole array)."""
+        f = np.minimum(eps * self.Ep, self.fpu * 0.999)
+        for _ in range(50):
+            ratio = np.maximum(f * self._inv_fpu, 1e-12)
+            rN = ratio ** self._N
+            eps_calc = f * self._inv_Ep + self._k * rN
+            deps_df = self._inv_Ep + self._k * self._N * (rN / ratio) * self._inv_fpu
+            residual = eps_calc - eps
+            if np.all(np.abs(residual) < 1e-12):
+                break
+            f = np.clip(f - residual / deps_df, 0.0, self.fpu * 0.9999)
+        return f
+
+    def _bilinear_vec(self, eps: np.ndarray) -> np.ndarray:
+        epy = self.fpy / self.Ep + 0.001
+        Ep2 = (self.fpu - self.fpy) / (self.epu - epy) if self.epu > epy else 0.0
+        return np.where(eps <= epy, self.Ep * eps, self.fpy + Ep2 * (eps - epy))
+
     def _power_formula(self, eps: float) -> float:
         """Inverse Ramberg-Osgood solved iteratively.
 
@@ -101,11 +168,13 @@ class PrestressingSteel:
         # Initial guess: elastic
         f = min(eps * self.Ep, self.fpu * 0.999)
         for _ in range(50):
-            ratio = f / self.fpu
+            ratio = f * self._inv_fpu
             if ratio <= 0:
                 ratio = 1e-12
-            eps_calc = f / self.Ep + self._k * ratio ** self._N
-            deps_df = 1.0 / self.Ep + self._k * self._N * ratio ** (self._N - 1.0) / self.fpu
+            # Share the pow: ratio^(N-1) = ratio^N / ratio
+            rN = ratio ** self._N
+            eps_calc = f * self._inv_Ep + self._k * rN
+            deps_df = self._inv_Ep + self._k * self._N * (rN / ratio) * self._inv_fpu
             residual = eps_calc - eps
             if abs(residual) < 1e-12:
                 break
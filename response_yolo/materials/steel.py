@@ -8,6 +8,10 @@ Supports:
 
 Sign convention: tension positive, compression negative (symmetric).
 
+Batch evaluation over fiber arrays goes through the *_vec methods, which
+run the piecewise model as NumPy mask arithmetic — one array pass per
+unique steel grade rather than a Python call per bar.
+
 Reference: Bentz (2000), Chapter 3.
 """
 
@@ -17,6 +21,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
+import numpy as np
+
 
 class SteelModel(Enum):
     BILINEAR = "bilinear"
@@ -84,6 +90,65 @@ class ReinforcingSteel:
         ds = 1.0e-8
         return (self.stress(strain + ds) - self.stress(strain - ds)) / (2.0 * ds)
 
+    def stress_and_tangent(self, strain: float) -> tuple:
+        """Return (stress, tangent) at the given strain in one call."""
+        ds = 1.0e-8
+        s1 = self.stress(strain - ds)
+        s2 = self.stress(strain + ds)
+        return self.stress(strain), (s2 - s1) / (2.0 * ds)
+
+    # ------------------------------------------------------------------
+    # Vectorized evaluation (NumPy) — used by the batched MCFT solver
+    # ------------------------------------------------------------------
+    def stress_vec(self, strain: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`stress` for an array of strains.
+
+        Fully branchless over the elements: the elastic / plateau /
+        hardening / fractured regions are selected with mask arithmetic,
+        since a fiber population typically spans all regions and
+        per-element branches would mispredict.
+        """
+        strain = np.asarray(strain, dtype=np.float64)
+        eps = np.abs(strain)
+        sign = np.copysign(1.0, strain)
+
+        if self.model == SteelModel.BILINEAR:
+            s = self._bilinear_vec(eps)
+        else:
+            s = self._trilinear_vec(eps)
+
+        return np.where(eps >= self.esu, 0.0, sign * s)
+
+    def tangent_vec(self, strain: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`tangent` (central difference)."""
+        strain = np.asarray(strain, dtype=np.float64)
+        ds = 1.0e-8
+        return (self.stress_vec(strain + ds) - self.stress_vec(strain - ds)) / (2.0 * ds)
+
+    def stress_and_tangent_vec(self, strain: np.ndarray) -> tuple:
+        """Vectorized :meth:`stress_and_tangent` via one stacked call."""
+        strain = np.asarray(strain, dtype=np.float64)
+        ds = 1.0e-8
+        n = strain.shape[0]
+        s = self.stress_vec(np.concatenate((strain, strain + ds, strain - ds)))
+        return s[:n], (s[n:2 * n] - s[2 * n:]) / (2.0 * ds)
+
+    def _bilinear_vec(self, eps: np.ndarray) -> np.ndarray:
+        Esh = (self.fu - self.fy) / (self.esu - self.ey) if self.esu > self.ey else 0.0
+        return np.where(eps <= self.ey, self.Es * eps, self.fy + Esh * (eps - self.ey))
+
+    def _trilinear_vec(self, eps: np.ndarray) -> np.ndarray:
+        if self.esu <= self.esh:
+            hardening = np.full_like(eps, self.fy)
+        else:
+            ratio = (eps - self.esh) / (self.esu - self.esh)
+            hardening = self.fy + (self.fu - self.fy) * (2.0 * ratio - ratio * ratio)
+        return np.where(
+            eps <= self.ey,
+            self.Es * eps,
+            np.where(eps <= self.esh, self.fy, hardening),
+        )
+
     def _bilinear(self, eps: float) -> float:
         if eps <= self.ey:
             return self.Es * eps
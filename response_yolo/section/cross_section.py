@@ -15,12 +15,29 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy as np
+
 from response_yolo.section.geometry import ConcreteLayer, _SectionShape
 from response_yolo.section.rebar import RebarBar, RebarLayer
 from response_yolo.section.tendon import Tendon
 from response_yolo.materials.concrete import Concrete
 from response_yolo.materials.steel import ReinforcingSteel
 
+# MCFT solver functions, bound lazily on first use.  Importing
+# response_yolo.analysis.mcft at module level would be circular:
+# analysis.__init__ imports moment_curvature, which imports this module.
+_solve_mcft_node = None
+_solve_mcft_node_batch = None
+
+
+def _bind_mcft_solvers() -> None:
+    """Resolve and cache the MCFT solvers as module globals (once)."""
+    global _solve_mcft_node, _solve_mcft_node_batch
+    from response_yolo.analysis.mcft import solve_mcft_node, solve_mcft_node_batch
+
+    _solve_mcft_node = solve_mcft_node
+    _solve_mcft_node_batch = solve_mcft_node_batch
+
 
 @dataclass
 class CrossSection:
@@ -45,6 +62,102 @@ class CrossSection:
     rebars: List[RebarBar] = field(default_factory=list)
     tendons: List[Tendon] = field(default_factory=list)
 
+    # Struct-of-Arrays cache for the hot integration loops.  Rebuilt lazily
+    # whenever the geometry version changes (see _bump_version).
+    _geom_version: int = field(init=False, repr=False, compare=False, default=0)
+    _soa_version: int = field(init=False, repr=False, compare=False, default=-1)
+    _gross_version: int = field(init=False, repr=False, compare=False, default=-1)
+    _trans_version: int = field(init=False, repr=False, compare=False, default=-1)
+
+    def __post_init__(self) -> None:
+        self._y_c = np.empty(0)   # concrete layer mid-heights
+        self._A_c = np.empty(0)   # concrete layer areas
+        self._w_c = np.empty(0)   # concrete layer widths
+        self._t_c = np.empty(0)   # concrete layer thicknesses
+        self._conc_single_mat: Optional[Concrete] = None
+        self._conc_groups: list = []  # [(material, layer-index array), ...]
+        self._rho_y_c = np.empty(0)  # transverse reinforcement ratios
+        self._stirrup_single_mat: Optional[ReinforcingSteel] = None
+        self._stirrup_uniform = True
+        self._y_r = np.empty(0)   # rebar elevations
+        self._A_r = np.empty(0)   # rebar areas
+        self._rebar_groups: list = []
+        self._y_t = np.empty(0)   # tendon elevations
+        self._A_t = np.empty(0)   # tendon areas
+        self._pre_t = np.empty(0)  # tendon prestrains
+        self._tendon_groups: list = []
+        self._yb = 0.0
+        self._yt = 0.0
+        self._Ag = 0.0
+        self._yc = 0.0
+        self._Ig = 0.0
+        self._trans_extra = 0.0
+
+    def _bump_version(self) -> None:
+        """Invalidate cached arrays after a geometry mutation."""
+        self._geom_version += 1
+
+    def _ensure_soa(self) -> None:
+        """(Re)build the concrete-layer SoA arrays if stale.
+
+        `_conc_single_mat` holds the shared Concrete when every layer
+        uses the same material (the overwhelmingly common case), which
+        enables a single vectorized stress/tangent call per integration.
+
+        All arrays are C-contiguous float64, so the fused integration
+        kernels could be handed to a compiled extension unchanged if one
+        is ever added.
+        """
+        if self._soa_version == self._geom_version:
+            return
+        layers = self.concrete_layers
+        self._y_c = np.array([lay.y_mid for lay in layers], dtype=np.float64)
+        self._A_c = np.array([lay.area for lay in layers], dtype=np.float64)
+        self._w_c = np.array([lay.width for lay in layers], dtype=np.float64)
+        self._t_c = np.array([lay.thickness for lay in layers], dtype=np.float64)
+        groups: dict = {}
+        for i, lay in enumerate(layers):
+            groups.setdefault(id(lay.material), (lay.material, []))[1].append(i)
+        self._conc_groups = [
+            (mat, np.array(idx, dtype=np.intp)) for mat, idx in groups.values()
+        ]
+        self._conc_single_mat = (
+            self._conc_groups[0][0] if len(self._conc_groups) == 1 else None
+        )
+        self._rho_y_c = np.array([lay.rho_y for lay in layers], dtype=np.float64)
+        smats = {
+            id(lay.stirrup_material): lay.stirrup_material
+            for lay in layers
+            if lay.stirrup_material is not None
+        }
+        self._stirrup_single_mat = next(iter(smats.values())) if len(smats) == 1 else None
+        self._stirrup_uniform = len(smats) <= 1
+        self._yb = layers[0].y_bot if layers else 0.0
+        self._yt = layers[-1].y_top if layers else 0.0
+
+        # Reinforcement SoA arrays, grouped by material like the layers
+        self._y_r = np.array([b.y for b in self.rebars], dtype=np.float64)
+        self._A_r = np.array([b.area for b in self.rebars], dtype=np.float64)
+        rgroups: dict = {}
+        for i, b in enumerate(self.rebars):
+            rgroups.setdefault(id(b.material), (b.material, []))[1].append(i)
+        self._rebar_groups = [
+            (mat, np.array(idx, dtype=np.intp)) for mat, idx in rgroups.values()
+        ]
+        n_t = len(self.tendons)
+        self._y_t = np.fromiter((t.y for t in self.tendons), np.float64, count=n_t)
+        self._A_t = np.fromiter((t.area for t in self.tendons), np.float64, count=n_t)
+        self._pre_t = np.fromiter(
+            (t.prestrain for t in self.tendons), np.float64, count=n_t
+        )
+        tgroups: dict = {}
+        for i, t in enumerate(self.tendons):
+            tgroups.setdefault(id(t.material), (t.material, []))[1].append(i)
+        self._tendon_groups = [
+            (mat, np.array(idx, dtype=np.intp)) for mat, idx in tgroups.values()
+        ]
+        self._soa_version = self._geom_version
+
     # ------------------------------------------------------------------
     # Constructors
     # ------------------------------------------------------------------
@@ -64,12 +177,15 @@ class CrossSection:
     # ------------------------------------------------------------------
     def add_rebar(self, bar: RebarBar) -> None:
         self.rebars.append(bar)
+        self._bump_version()
 
     def add_rebar_layer(self, layer: RebarLayer) -> None:
         self.rebars.append(layer.to_bar())
+        self._bump_version()
 
     def add_tendon(self, tendon: Tendon) -> None:
         self.tendons.append(tendon)
+        self._bump_version()
 
     def set_stirrups(
         self,
@@ -100,6 +216,7 @@ class CrossSection:
                 continue
             lay.rho_y = Av / (lay.width * s)
             lay.stirrup_material = material
+        self._bump_version()
 
     # ------------------------------------------------------------------
     # Gross section properties
@@ -108,44 +225,61 @@ class CrossSection:
     def height(self) -> float:
         if not self.concrete_layers:
             return 0.0
-        return self.concrete_layers[-1].y_top - self.concrete_layers[0].y_bot
+        self._ensure_soa()
+        return self._yt - self._yb
 
     @property
     def y_bottom(self) -> float:
         if not self.concrete_layers:
             return 0.0
-        return self.concrete_layers[0].y_bot
+        self._ensure_soa()
+        return self._yb
 
     @property
     def y_top(self) -> float:
         if not self.concrete_layers:
             return 0.0
-        return self.concrete_layers[-1].y_top
+        self._ensure_soa()
+        return self._yt
+
+    def _ensure_gross_props(self) -> None:
+        """Recompute (Ag, yc, Ig) in one fused pass if the geometry changed.
+
+        Reading Ig previously re-summed the layers for yc, which re-summed
+        them again for Ag — three traversals for one property read.  All
+        three are now memoized against the geometry version counter.
+        """
+        if self._gross_version == self._geom_version:
+            return
+        self._ensure_soa()
+        Ag = float(self._A_c.sum())
+        Ay = float(np.dot(self._A_c, self._y_c))
+        Ayy = float(np.dot(self._A_c, self._y_c * self._y_c))
+        I_own = float(np.dot(self._w_c, self._t_c ** 3)) / 12.0
+        yc = Ay / Ag if Ag != 0.0 else 0.0
+        self._Ag = Ag
+        self._yc = yc
+        # Shift-axis identity: sum A*(y - yc)^2 = sum A*y^2 - Ag*yc^2
+        self._Ig = I_own + Ayy - Ag * yc * yc
+        self._gross_version = self._geom_version
 
     @property
     def gross_area(self) -> float:
         """Gross concrete area (ignoring reinforcement)."""
-        return sum(lay.area for lay in self.concrete_layers)
+        self._ensure_gross_props()
+        return self._Ag
 
     @property
     def centroid_y(self) -> float:
         """Y-coordinate of gross concrete centroid from section bottom."""
-        total_Ay = sum(lay.area * lay.y_mid for lay in self.concrete_layers)
-        total_A = self.gross_area
-        if total_A == 0:
-            return 0.0
-        return total_Ay / total_A
+        self._ensure_gross_props()
+        return self._yc
 
     @property
     def gross_moment_of_inertia(self) -> float:
         """Gross (uncracked, unreinforced) moment of inertia about centroid."""
-        yc = self.centroid_y
-        Ig = 0.0
-        for lay in self.concrete_layers:
-            # Parallel axis theorem per layer
-            Ig += lay.width * lay.thickness ** 3 / 12.0
-            Ig += lay.area * (lay.y_mid - yc) ** 2
-        return Ig
+        self._ensure_gross_props()
+        return self._Ig
 
     # ------------------------------------------------------------------
     # Transformed section properties
@@ -153,18 +287,34 @@ class CrossSection:
     @property
     def transformed_area(self) -> float:
         """Transformed area (concrete + n*As)."""
-        Ag = self.gross_area
-        # Use first layer's Ec as reference
         if not self.concrete_layers:
             return 0.0
-        Ec = self.concrete_layers[0].material.Ec
-        for bar in self.rebars:
-            n = bar.material.Es / Ec
-            Ag += (n - 1.0) * bar.area
-        for t in self.tendons:
-            n = t.material.Ep / Ec
-            Ag += (n - 1.0) * t.area
-        return Ag
+        if self._trans_version != self._geom_version:
+            # Group reinforcement by material so the modular ratio is
+            # computed once per unique steel grade, not once per bar.
+            Ec = self.concrete_layers[0].material.Ec
+            rebar_areas: dict = {}
+            for bar in self.rebars:
+                key = id(bar.material)
+                rebar_areas[key] = (
+                    bar.material,
+                    rebar_areas.get(key, (None, 0.0))[1] + bar.area,
+                )
+            tendon_areas: dict = {}
+            for t in self.tendons:
+                key = id(t.material)
+                tendon_areas[key] = (
+                    t.material,
+                    tendon_areas.get(key, (None, 0.0))[1] + t.area,
+                )
+            extra = 0.0
+            for mat, A in rebar_areas.values():
+                extra += (mat.Es / Ec - 1.0) * A
+            for mat, A in tendon_areas.values():
+                extra += (mat.Ep / Ec - 1.0) * A
+            self._trans_extra = extra
+            self._trans_version = self._geom_version
+        return self.gross_area + self._trans_extra
 
     # ------------------------------------------------------------------
     # Force/moment integration for a given strain profile
@@ -196,35 +346,44 @@ class CrossSection:
         M : float
             Bending moment about y_ref (positive = sagging / tension at bottom).
         """
+        self._ensure_soa()
         N = 0.0
         M = 0.0
 
-        # Concrete layers
-        for lay in self.concrete_layers:
-            dy = lay.y_mid - y_ref
-            eps = eps_0 - phi * dy
-            sig = lay.material.stress(eps)
-            f = sig * lay.area
-            N += f
-            M -= f * dy  # M = -sum(f * dy) so tension at bottom → positive M
-
-        # Reinforcing bars
-        for bar in self.rebars:
-            dy = bar.y - y_ref
-            eps = eps_0 - phi * dy
-            sig = bar.material.stress(eps)
-            f = sig * bar.area
-            N += f
-            M -= f * dy
+        # Concrete layers — vectorized over the SoA arrays
+        if self.concrete_layers:
+            dy_arr = self._y_c - y_ref
+            eps_arr = eps_0 - phi * dy_arr
+            if self._conc_single_mat is not None:
+                sig_arr = self._conc_single_mat.stress_vec(eps_arr)
+            else:
+                # Mixed materials — one vectorized call per material group
+                sig_arr = np.empty_like(eps_arr)
+                for mat, idx in self._conc_groups:
+                    sig_arr[idx] = mat.stress_vec(eps_arr[idx])
+            N += float(np.dot(sig_arr, self._A_c))
+            # M = -sum(f * dy) so tension at bottom → positive M
+            M -= float(np.einsum("i,i,i->", sig_arr, self._A_c, dy_arr))
+
+        # Reinforcing bars — one vectorized call per steel grade
+        if self.rebars:
+            dy_r = self._y_r - y_ref
+            eps_r = eps_0 - phi * dy_r
+            sig_r = np.empty_like(eps_r)
+            for mat, idx in self._rebar_groups:
+                sig_r[idx] = mat.stress_vec(eps_r[idx])
+            N += float(np.dot(sig_r, self._A_r))
+            M -= float(np.einsum("i,i,i->", sig_r, self._A_r, dy_r))
 
         # Tendons (add prestrain)
-        for t in self.tendons:
-            dy = t.y - y_ref
-            eps = eps_0 - phi * dy + t.prestrain
-            sig = t.material.stress(eps)
-            f = sig * t.area
-            N += f
-            M -= f * dy
+        if self.tendons:
+            dy_t = self._y_t - y_ref
+            eps_t = eps_0 - phi * dy_t + self._pre_t
+            sig_t = np.empty_like(eps_t)
+            for mat, idx in self._tendon_groups:
+                sig_t[idx] = mat.stress_vec(eps_t[idx])
+            N += float(np.dot(sig_t, self._A_t))
+            M -= float(np.einsum("i,i,i->", sig_t, self._A_t, dy_t))
 
         return N, M
 
@@ -241,38 +400,123 @@ class CrossSection:
         ES : float  – coupling: dN/d(phi)
         EI : float  – dM/d(phi)
         """
+        self._ensure_soa()
         EA = 0.0
         ES = 0.0
         EI = 0.0
 
-        for lay in self.concrete_layers:
-            dy = lay.y_mid - y_ref
-            eps = eps_0 - phi * dy
-            Et = lay.material.tangent(eps)
-            ea = Et * lay.area
-            EA += ea
-            ES -= ea * dy       # dN/dphi = sum(Et*A * d(eps)/d(phi)) = sum(Et*A*(-dy))
-            EI += ea * dy * dy  # dM/dphi = sum(Et*A*dy * d(eps)/d(phi)*(-dy)/(-1)) = sum(Et*A*dy^2)
+        if self.concrete_layers:
+            dy_arr = self._y_c - y_ref
+            eps_arr = eps_0 - phi * dy_arr
+            if self._conc_single_mat is not None:
+                Et_arr = self._conc_single_mat.tangent_vec(eps_arr)
+            else:
+                Et_arr = np.empty_like(eps_arr)
+                for mat, idx in self._conc_groups:
+                    Et_arr[idx] = mat.tangent_vec(eps_arr[idx])
+            EA += float(np.dot(Et_arr, self._A_c))
+            # dN/dphi = sum(Et*A * d(eps)/d(phi)) = sum(Et*A*(-dy))
+            ES -= float(np.einsum("i,i,i->", Et_arr, self._A_c, dy_arr))
+            # dM/dphi = sum(Et*A*dy * d(eps)/d(phi)*(-dy)/(-1)) = sum(Et*A*dy^2)
+            EI += float(np.einsum("i,i,i,i->", Et_arr, self._A_c, dy_arr, dy_arr))
+
+        if self.rebars:
+            dy_r = self._y_r - y_ref
+            eps_r = eps_0 - phi * dy_r
+            Et_r = np.empty_like(eps_r)
+            for mat, idx in self._rebar_groups:
+                Et_r[idx] = mat.tangent_vec(eps_r[idx])
+            EA += float(np.dot(Et_r, self._A_r))
+            ES -= float(np.einsum("i,i,i->", Et_r, self._A_r, dy_r))
+            EI += float(np.einsum("i,i,i,i->", Et_r, self._A_r, dy_r, dy_r))
+
+        if self.tendons:
+            dy_t = self._y_t - y_ref
+            eps_t = eps_0 - phi * dy_t + self._pre_t
+            Et_t = np.empty_like(eps_t)
+            for mat, idx in self._tendon_groups:
+                Et_t[idx] = mat.tangent_vec(eps_t[idx])
+            EA += float(np.dot(Et_t, self._A_t))
+            ES -= float(np.einsum("i,i,i->", Et_t, self._A_t, dy_t))
+            EI += float(np.einsum("i,i,i,i->", Et_t, self._A_t, dy_t, dy_t))
 
-        for bar in self.rebars:
-            dy = bar.y - y_ref
-            eps = eps_0 - phi * dy
-            Et = bar.material.tangent(eps)
-            ea = Et * bar.area
-            EA += ea
-            ES -= ea * dy
-            EI += ea * dy * dy
+        return EA, ES, EI
 
-        for t in self.tendons:
-            dy = t.y - y_ref
-            eps = eps_0 - phi * dy + t.prestrain
-            Et = t.material.tangent(eps)
-            ea = Et * t.area
-            EA += ea
-            ES -= ea * dy
-            EI += ea * dy * dy
+    def prepare(self, y_ref: float) -> "_PreparedSection":
+        """Freeze the y_ref-dependent integration arrays for reuse.
 
-        return EA, ES, EI
+        Newton solves hold y_ref fixed (usually the centroid) while
+        varying only (eps_0, phi); the returned object precomputes the
+        dy arrays and per-bar offsets once so each iteration pays only
+        the strain evaluation.  It refreshes itself automatically if the
+        section geometry changes.
+        """
+        return _PreparedSection(self, y_ref)
+
+    def integrate_forces_and_stiffness(
+        self, eps_0: float, phi: float, y_ref: float
+    ) -> tuple:
+        """Fused :meth:`integrate_forces` + :meth:`integrate_stiffness`.
+
+        Newton-Raphson callers need the forces and the tangent at the
+        same strain state; evaluating them together shares the dy/eps
+        arrays and the per-bar strain computations instead of traversing
+        the section twice.
+
+        Returns
+        -------
+        (N, M, EA, ES, EI) : tuple of float
+        """
+        self._ensure_soa()
+        N = 0.0
+        M = 0.0
+        EA = 0.0
+        ES = 0.0
+        EI = 0.0
+
+        if self.concrete_layers:
+            dy_arr = self._y_c - y_ref
+            eps_arr = eps_0 - phi * dy_arr
+            if self._conc_single_mat is not None:
+                sig_arr, Et_arr = self._conc_single_mat.stress_and_tangent_vec(eps_arr)
+            else:
+                sig_arr = np.empty_like(eps_arr)
+                Et_arr = np.empty_like(eps_arr)
+                for mat, idx in self._conc_groups:
+                    sig_arr[idx], Et_arr[idx] = mat.stress_and_tangent_vec(eps_arr[idx])
+            N += float(np.dot(sig_arr, self._A_c))
+            M -= float(np.einsum("i,i,i->", sig_arr, self._A_c, dy_arr))
+            EA += float(np.dot(Et_arr, self._A_c))
+            ES -= float(np.einsum("i,i,i->", Et_arr, self._A_c, dy_arr))
+            EI += float(np.einsum("i,i,i,i->", Et_arr, self._A_c, dy_arr, dy_arr))
+
+        if self.rebars:
+            dy_r = self._y_r - y_ref
+            eps_r = eps_0 - phi * dy_r
+            sig_r = np.empty_like(eps_r)
+            Et_r = np.empty_like(eps_r)
+            for mat, idx in self._rebar_groups:
+                sig_r[idx], Et_r[idx] = mat.stress_and_tangent_vec(eps_r[idx])
+            N += float(np.dot(sig_r, self._A_r))
+            M -= float(np.einsum("i,i,i->", sig_r, self._A_r, dy_r))
+            EA += float(np.dot(Et_r, self._A_r))
+            ES -= float(np.einsum("i,i,i->", Et_r, self._A_r, dy_r))
+            EI += float(np.einsum("i,i,i,i->", Et_r, self._A_r, dy_r, dy_r))
+
+        if self.tendons:
+            dy_t = self._y_t - y_ref
+            eps_t = eps_0 - phi * dy_t + self._pre_t
+            sig_t = np.empty_like(eps_t)
+            Et_t = np.empty_like(eps_t)
+            for mat, idx in self._tendon_groups:
+                sig_t[idx], Et_t[idx] = mat.stress_and_tangent_vec(eps_t[idx])
+            N += float(np.dot(sig_t, self._A_t))
+            M -= float(np.einsum("i,i,i->", sig_t, self._A_t, dy_t))
+            EA += float(np.dot(Et_t, self._A_t))
+            ES -= float(np.einsum("i,i,i->", Et_t, self._A_t, dy_t))
+            EI += float(np.einsum("i,i,i,i->", Et_t, self._A_t, dy_t, dy_t))
+
+        return N, M, EA, ES, EI
 
     # ------------------------------------------------------------------
     # 3-DOF force/stiffness integration (for shear analysis)
@@ -328,35 +572,57 @@ class CrossSection:
         M : float – Bending moment about y_ref (positive sagging).
         V : float – Shear force.
         """
-        from response_yolo.analysis.mcft import solve_mcft_node
+        if _solve_mcft_node is None:
+            _bind_mcft_solvers()
 
         N = 0.0
         M = 0.0
         V = 0.0
 
-        yb = self.y_bottom
-        yt = self.y_top
-
-        # Concrete layers (MCFT biaxial)
-        for lay in self.concrete_layers:
-            dy = lay.y_mid - y_ref
-            eps_x = eps_0 - phi * dy
-            s = self.shear_strain_profile(lay.y_mid, yb, yt)
-            gamma = gamma_xy0 * s
-
-            state = solve_mcft_node(
-                eps_x=eps_x,
-                gamma_xy=gamma,
-                concrete=lay.material,
-                rho_y=lay.rho_y,
-                stirrup_material=lay.stirrup_material,
-            )
-
-            f_x = state.sigma_x * lay.area
-            f_v = state.tau_xy * lay.area
-            N += f_x
-            M -= f_x * dy
-            V += f_v
+        # Concrete layers (MCFT biaxial) — strains and the parabolic shear
+        # profile are computed for all layers in one vectorized pass; when
+        # all layers share one concrete (and at most one stirrup) material
+        # the node solves are batched into a single vectorized call too.
+        if self.concrete_layers:
+            self._ensure_soa()
+            yb = self.y_bottom
+            yt = self.y_top
+            h = yt - yb
+            dy_arr = self._y_c - y_ref
+            eps_arr = eps_0 - phi * dy_arr
+            if h > 0:
+                eta = 2.0 * (self._y_c - 0.5 * (yb + yt)) / h
+                s_arr = 1.5 * (1.0 - eta * eta)
+            else:
+                s_arr = np.ones_like(self._y_c)
+            gamma_arr = gamma_xy0 * s_arr
+
+            if self._conc_single_mat is not None and self._stirrup_uniform:
+                sig_x_arr, tau_arr = _solve_mcft_node_batch(
+                    eps_arr,
+                    gamma_arr,
+                    self._conc_single_mat,
+                    rho_y=self._rho_y_c,
+                    stirrup_material=self._stirrup_single_mat,
+                )
+            else:
+                # Mixed materials — per-layer dispatch
+                sig_x_arr = np.empty_like(eps_arr)
+                tau_arr = np.empty_like(eps_arr)
+                for i, lay in enumerate(self.concrete_layers):
+                    state = _solve_mcft_node(
+                        eps_x=float(eps_arr[i]),
+                        gamma_xy=float(gamma_arr[i]),
+                        concrete=lay.material,
+                        rho_y=lay.rho_y,
+                        stirrup_material=lay.stirrup_material,
+                    )
+                    sig_x_arr[i] = state.sigma_x
+                    tau_arr[i] = state.tau_xy
+
+            N += float(np.dot(sig_x_arr, self._A_c))
+            M -= float(np.einsum("i,i,i->", sig_x_arr, self._A_c, dy_arr))
+            V += float(np.dot(tau_arr, self._A_c))
 
         # Reinforcing bars (uniaxial — same as existing)
         for bar in self.rebars:
@@ -385,7 +651,18 @@ class CrossSection:
         gamma_xy0: float,
         y_ref: float,
     ) -> list:
-        """Compute 3×3 tangent stiffness matrix via finite differences.
+        """Compute 3×3 tangent stiffness matrix from layer tangents.
+
+        Assembled in a single pass from the condensed 2×2 tangent that
+        each converged MCFT node already provides, using the chain rule
+        for the strain profile:
+
+            d(eps_x)/d(eps_0)  = 1
+            d(eps_x)/d(phi)    = -dy
+            d(gamma)/d(gamma0) = s(y)
+
+        This replaces the previous finite-difference scheme, which cost
+        four full integrate_forces_shear passes per evaluation.
 
         Returns a 3×3 list-of-lists:
             [[dN/de0,  dN/dphi,  dN/dg ],
@@ -394,47 +671,253 @@ class CrossSection:
 
         Reference: Bentz (2000), Chapter 7.
         """
-        N0, M0, V0 = self.integrate_forces_shear(eps_0, phi, gamma_xy0, y_ref)
+        if _solve_mcft_node is None:
+            _bind_mcft_solvers()
+        self._ensure_soa()
 
-        h_e = max(abs(eps_0) * 1e-6, 1e-9)
-        h_p = max(abs(phi) * 1e-6, 1e-12)
-        h_g = max(abs(gamma_xy0) * 1e-6, 1e-9)
+        J = [[0.0, 0.0, 0.0],
+             [0.0, 0.0, 0.0],
+             [0.0, 0.0, 0.0]]
 
-        N1, M1, V1 = self.integrate_forces_shear(eps_0 + h_e, phi, gamma_xy0, y_ref)
-        N2, M2, V2 = self.integrate_forces_shear(eps_0, phi + h_p, gamma_xy0, y_ref)
-        N3, M3, V3 = self.integrate_forces_shear(eps_0, phi, gamma_xy0 + h_g, y_ref)
+        yb = self.y_bottom
+        yt = self.y_top
+        h = yt - yb
+        inv_h = 2.0 / h if h > 0 else 0.0
+        y_mid_sec = 0.5 * (yb + yt)
 
-        return [
-            [(N1 - N0) / h_e, (N2 - N0) / h_p, (N3 - N0) / h_g],
-            [(M1 - M0) / h_e, (M2 - M0) / h_p, (M3 - M0) / h_g],
-            [(V1 - V0) / h_e, (V2 - V0) / h_p, (V3 - V0) / h_g],
-        ]
+        # Concrete layers (condensed MCFT tangents); the parabolic shear
+        # profile is inlined with the section extents hoisted out of the loop
+        for lay in self.concrete_layers:
+            dy = lay.y_mid - y_ref
+            eps_x = eps_0 - phi * dy
+            if h > 0:
+                eta = (lay.y_mid - y_mid_sec) * inv_h
+                s = 1.5 * (1.0 - eta * eta)
+            else:
+                s = 1.0
+            gamma = gamma_xy0 * s
+
+            state = _solve_mcft_node(
+                eps_x=eps_x,
+                gamma_xy=gamma,
+                concrete=lay.material,
+                rho_y=lay.rho_y,
+                stirrup_material=lay.stirrup_material,
+            )
+
+            j = state.tangent_xx * lay.area    # dsigma_x/deps_x * A
+            k_g = state.tangent_xg * lay.area  # dsigma_x/dgamma * A
+            t_x = state.tangent_gx * lay.area  # dtau/deps_x * A
+            t_g = state.tangent_gg * lay.area  # dtau/dgamma * A
+
+            J[0][0] += j
+            J[0][1] += -j * dy
+            J[0][2] += k_g * s
+
+            J[1][0] += -dy * j
+            J[1][1] += dy * dy * j
+            J[1][2] += -dy * k_g * s
+
+            J[2][0] += t_x
+            J[2][1] += -t_x * dy
+            J[2][2] += t_g * s
+
+        # Rebars and tendons (uniaxial — no shear coupling), via the
+        # grouped vectorised tangents like the 2-DOF stiffness path
+        if self.rebars:
+            dy_r = self._y_r - y_ref
+            eps_r = eps_0 - phi * dy_r
+            Et_r = np.empty_like(eps_r)
+            for mat, idx in self._rebar_groups:
+                Et_r[idx] = mat.tangent_vec(eps_r[idx])
+            ea_r = Et_r * self._A_r
+            ea_dy = float(np.dot(ea_r, dy_r))
+            J[0][0] += float(ea_r.sum())
+            J[0][1] -= ea_dy
+            J[1][0] -= ea_dy
+            J[1][1] += float(np.dot(ea_r, dy_r * dy_r))
+
+        if self.tendons:
+            dy_t = self._y_t - y_ref
+            eps_t = eps_0 - phi * dy_t + self._pre_t
+            Et_t = np.empty_like(eps_t)
+            for mat, idx in self._tendon_groups:
+                Et_t[idx] = mat.tangent_vec(eps_t[idx])
+            ea_t = Et_t * self._A_t
+            ea_dy = float(np.dot(ea_t, dy_t))
+            J[0][0] += float(ea_t.sum())
+            J[0][1] -= ea_dy
+            J[1][0] -= ea_dy
+            J[1][1] += float(np.dot(ea_t, dy_t * dy_t))
+
+        return J
 
     # ------------------------------------------------------------------
     # Serialization
     # ------------------------------------------------------------------
     def to_dict(self) -> dict:
+        """Serialize to a dictionary.
+
+        Materials are deduplicated by identity: each unique material is
+        serialized once into the "materials" list and layers/bars refer
+        to it by index.  All 100 layers of a typical section share one
+        Concrete, so this is O(unique materials) material dicts instead
+        of O(layers).
+        """
+        materials: list = []
+        mat_index: dict = {}
+
+        def _mat_idx(mat) -> int:
+            key = id(mat)
+            i = mat_index.get(key)
+            if i is None:
+                i = len(materials)
+                mat_index[key] = i
+                materials.append(mat.to_dict())
+            return i
+
         return {
+            "materials": materials,
             "concrete_layers": [
                 {
                     "y_bot": l.y_bot,
                     "y_top": l.y_top,
                     "width": l.width,
-                    "material": l.material.to_dict(),
+                    "mat_idx": _mat_idx(l.material),
                 }
                 for l in self.concrete_layers
             ],
             "rebars": [
-                {"y": b.y, "area": b.area, "material": b.material.to_dict()}
+                {"y": b.y, "area": b.area, "mat_idx": _mat_idx(b.material)}
                 for b in self.rebars
             ],
             "tendons": [
                 {
                     "y": t.y,
                     "area": t.area,
-                    "material": t.material.to_dict(),
+                    "mat_idx": _mat_idx(t.material),
                     "prestrain": t.prestrain,
                 }
                 for t in self.tendons
             ],
         }
+
+
+class _PreparedSection:
+    """Section integration with invariants frozen for a fixed y_ref.
+
+    Built by :meth:`CrossSection.prepare`.  Holds the concrete dy / dy^2
+    arrays and flattened (dy, area, material) tuples for rebars and
+    tendons so that repeated integration calls only evaluate
+    eps = eps_0 - phi*dy and the material models.  The cached arrays are
+    rebuilt lazily whenever the section's geometry version changes.
+    """
+
+    __slots__ = ("_section", "_y_ref", "_version", "_dy_c", "_dy2_c", "_dy_r", "_dy_t")
+
+    def __init__(self, section: CrossSection, y_ref: float) -> None:
+        self._section = section
+        self._y_ref = y_ref
+        self._version = -1
+        self._refresh()
+
+    def _refresh(self) -> None:
+        sec = self._section
+        sec._ensure_soa()
+        self._dy_c = sec._y_c - self._y_ref
+        self._dy2_c = self._dy_c * self._dy_c
+        self._dy_r = sec._y_r - self._y_ref
+        self._dy_t = sec._y_t - self._y_ref
+        self._version = sec._geom_version
+
+    def integrate_forces(self, eps_0: float, phi: float) -> tuple:
+        """Same as :meth:`CrossSection.integrate_forces` at the frozen y_ref."""
+        sec = self._section
+        if self._version != sec._geom_version:
+            self._refresh()
+
+        N = 0.0
+        M = 0.0
+
+        if sec.concrete_layers:
+            eps_arr = eps_0 - phi * self._dy_c
+            if sec._conc_single_mat is not None:
+                sig_arr = sec._conc_single_mat.stress_vec(eps_arr)
+            else:
+                sig_arr = np.empty_like(eps_arr)
+                for mat, idx in sec._conc_groups:
+                    sig_arr[idx] = mat.stress_vec(eps_arr[idx])
+            N += float(np.dot(sig_arr, sec._A_c))
+            M -= float(np.einsum("i,i,i->", sig_arr, sec._A_c, self._dy_c))
+
+        if sec.rebars:
+            eps_r = eps_0 - phi * self._dy_r
+            sig_r = np.empty_like(eps_r)
+            for mat, idx in sec._rebar_groups:
+                sig_r[idx] = mat.stress_vec(eps_r[idx])
+            N += float(np.dot(sig_r, sec._A_r))
+            M -= float(np.einsum("i,i,i->", sig_r, sec._A_r, self._dy_r))
+
+        if sec.tendons:
+            eps_t = eps_0 - phi * self._dy_t + sec._pre_t
+            sig_t = np.empty_like(eps_t)
+            for mat, idx in sec._tendon_groups:
+                sig_t[idx] = mat.stress_vec(eps_t[idx])
+            N += float(np.dot(sig_t, sec._A_t))
+            M -= float(np.einsum("i,i,i->", sig_t, sec._A_t, self._dy_t))
+
+        return N, M
+
+    def integrate_forces_and_stiffness(self, eps_0: float, phi: float) -> tuple:
+        """Same as :meth:`CrossSection.integrate_forces_and_stiffness`
+        at the frozen y_ref."""
+        sec = self._section
+        if self._version != sec._geom_version:
+            self._refresh()
+
+        N = 0.0
+        M = 0.0
+        EA = 0.0
+        ES = 0.0
+        EI = 0.0
+
+        if sec.concrete_layers:
+            eps_arr = eps_0 - phi * self._dy_c
+            if sec._conc_single_mat is not None:
+                sig_arr, Et_arr = sec._conc_single_mat.stress_and_tangent_vec(eps_arr)
+            else:
+                sig_arr = np.empty_like(eps_arr)
+                Et_arr = np.empty_like(eps_arr)
+                for mat, idx in sec._conc_groups:
+                    sig_arr[idx], Et_arr[idx] = mat.stress_and_tangent_vec(eps_arr[idx])
+            N += float(np.dot(sig_arr, sec._A_c))
+            M -= float(np.einsum("i,i,i->", sig_arr, sec._A_c, self._dy_c))
+            EA += float(np.dot(Et_arr, sec._A_c))
+            ES -= float(np.einsum("i,i,i->", Et_arr, sec._A_c, self._dy_c))
+            EI += float(np.einsum("i,i,i->", Et_arr, sec._A_c, self._dy2_c))
+
+        if sec.rebars:
+            eps_r = eps_0 - phi * self._dy_r
+            sig_r = np.empty_like(eps_r)
+            Et_r = np.empty_like(eps_r)
+            for mat, idx in sec._rebar_groups:
+                sig_r[idx], Et_r[idx] = mat.stress_and_tangent_vec(eps_r[idx])
+            N += float(np.dot(sig_r, sec._A_r))
+            M -= float(np.einsum("i,i,i->", sig_r, sec._A_r, self._dy_r))
+            EA += float(np.dot(Et_r, sec._A_r))
+            ES -= float(np.einsum("i,i,i->", Et_r, sec._A_r, self._dy_r))
+            EI += float(np.einsum("i,i,i,i->", Et_r, sec._A_r, self._dy_r, self._dy_r))
+
+        if sec.tendons:
+            eps_t = eps_0 - phi * self._dy_t + sec._pre_t
+            sig_t = np.empty_like(eps_t)
+            Et_t = np.empty_like(eps_t)
+            for mat, idx in sec._tendon_groups:
+                sig_t[idx], Et_t[idx] = mat.stress_and_tangent_vec(eps_t[idx])
+            N += float(np.dot(sig_t, sec._A_t))
+            M -= float(np.einsum("i,i,i->", sig_t, sec._A_t, self._dy_t))
+            EA += float(np.dot(Et_t, sec._A_t))
+            ES -= float(np.einsum("i,i,i->", Et_t, sec._A_t, self._dy_t))
+            EI += float(np.einsum("i,i,i,i->", Et_t, sec._A_t, self._dy_t, self._dy_t))
+
+        return N, M, EA, ES, EI
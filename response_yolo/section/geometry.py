@@ -21,10 +21,13 @@ Supported section shapes:
 
 from __future__ import annotations
 
+import bisect
 import math
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy as np
+
 from response_yolo.materials.concrete import Concrete
 
 # Avoid circular import — steel is only needed at runtime for type hints
@@ -34,7 +37,7 @@ if TYPE_CHECKING:
     from response_yolo.materials.steel import ReinforcingSteel
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ConcreteLayer:
     """A single horizontal concrete fibre (layer).
 
@@ -53,6 +56,9 @@ class ConcreteLayer:
         Default 0.0 (no stirrups).  Used by MCFT biaxial analysis.
     stirrup_material : ReinforcingSteel or None
         Material for transverse reinforcement.  None means no stirrups.
+    y_mid, thickness, area : float
+        Derived geometry, computed once at construction (these are hit
+        per layer per Newton iteration in the integration loops).
     """
 
     y_bot: float
@@ -62,17 +68,16 @@ class ConcreteLayer:
     rho_y: float = 0.0
     stirrup_material: Optional["ReinforcingSteel"] = None
 
-    @property
-    def y_mid(self) -> float:
-        return 0.5 * (self.y_bot + self.y_top)
-
-    @property
-    def thickness(self) -> float:
-        return self.y_top - self.y_bot
+    # Derived geometry — cached at construction rather than recomputed
+    # per property access in the hot loops.
+    y_mid: float = field(init=False)
+    thickness: float = field(init=False)
+    area: float = field(init=False)
 
-    @property
-    def area(self) -> float:
-        return self.width * self.thickness
+    def __post_init__(self) -> None:
+        self.y_mid = 0.5 * (self.y_bot + self.y_top)
+        self.thickness = self.y_top - self.y_bot
+        self.area = self.width * self.thickness
 
 
 class _SectionShape:
@@ -82,6 +87,16 @@ class _SectionShape:
         """Return section width at elevation y (from bottom)."""
         raise NotImplementedError
 
+    def widths_at(self, y: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`width_at` for an array of elevations.
+
+        Subclasses override this with closed-form array expressions; the
+        base implementation falls back to per-element width_at calls.
+        """
+        return np.fromiter(
+            (self.width_at(float(yi)) for yi in y), dtype=np.float64, count=len(y)
+        )
+
     @property
     def height(self) -> float:
         raise NotImplementedError
@@ -90,15 +105,14 @@ class _SectionShape:
         """Slice the section into n_layers horizontal concrete layers."""
         h = self.height
         t = h / n_layers
-        layers = []
-        for i in range(n_layers):
-            y_bot = i * t
-            y_top = (i + 1) * t
-            y_mid = 0.5 * (y_bot + y_top)
-            w = self.width_at(y_mid)
-            if w > 0:
-                layers.append(ConcreteLayer(y_bot=y_bot, y_top=y_top, width=w, material=material))
-        return layers
+        y_bot = np.arange(n_layers, dtype=np.float64) * t
+        y_top = y_bot + t
+        w = self.widths_at(0.5 * (y_bot + y_top))
+        return [
+            ConcreteLayer(y_bot=float(yb), y_top=float(yt), width=float(wi), material=material)
+            for yb, yt, wi in zip(y_bot, y_top, w)
+            if wi > 0
+        ]
 
 
 @dataclass
@@ -123,6 +137,17 @@ class RectangularSection(_SectionShape):
             return self.b
         return 0.0
 
+    def widths_at(self, y: np.ndarray) -> np.ndarray:
+        return np.where((y >= 0) & (y <= self.h), self.b, 0.0)
+
+    def discretise(self, material: Concrete, n_layers: int = 100) -> List[ConcreteLayer]:
+        """Analytic discretisation — every layer has width b."""
+        t = self.h / n_layers
+        return [
+            ConcreteLayer(y_bot=i * t, y_top=(i + 1) * t, width=self.b, material=material)
+            for i in range(n_layers)
+        ]
+
 
 @dataclass
 class TeeSection(_SectionShape):
@@ -152,6 +177,30 @@ class TeeSection(_SectionShape):
             return self.bw
         return self.bf
 
+    def widths_at(self, y: np.ndarray) -> np.ndarray:
+        return np.where(
+            (y < 0) | (y > self.height),
+            0.0,
+            np.where(y <= self.hw, self.bw, self.bf),
+        )
+
+    def discretise(self, material: Concrete, n_layers: int = 100) -> List[ConcreteLayer]:
+        """Analytic discretisation — the web/flange split index is
+        computed once instead of testing every layer midpoint."""
+        t = self.height / n_layers
+        # Web layers are those whose midpoint (i + 0.5)*t lies at or
+        # below hw, i.e. i <= hw/t - 0.5.
+        n_web = max(0, min(n_layers, math.floor(self.hw / t + 0.5)))
+        layers = [
+            ConcreteLayer(y_bot=i * t, y_top=(i + 1) * t, width=self.bw, material=material)
+            for i in range(n_web)
+        ]
+        layers += [
+            ConcreteLayer(y_bot=i * t, y_top=(i + 1) * t, width=self.bf, material=material)
+            for i in range(n_web, n_layers)
+        ]
+        return layers
+
 
 @dataclass
 class CircularSection(_SectionShape):
@@ -175,6 +224,15 @@ class CircularSection(_SectionShape):
             return 0.0
         return 2.0 * math.sqrt(r * r - dy * dy)
 
+    def widths_at(self, y: np.ndarray) -> np.ndarray:
+        r = self.diameter / 2.0
+        dy = y - r
+        return np.where(
+            np.abs(dy) >= r,
+            0.0,
+            2.0 * np.sqrt(np.maximum(r * r - dy * dy, 0.0)),
+        )
+
 
 @dataclass
 class GenericSection(_SectionShape):
@@ -189,22 +247,25 @@ class GenericSection(_SectionShape):
 
     def __post_init__(self) -> None:
         self.profile.sort(key=lambda p: p[0])
+        # Precomputed profile arrays for O(log n) / vectorized lookups.
+        self._ys = np.fromiter((p[0] for p in self.profile), dtype=np.float64)
+        self._ws = np.fromiter((p[1] for p in self.profile), dtype=np.float64)
 
     @property
     def height(self) -> float:
         return self.profile[-1][0] - self.profile[0][0]
 
     def width_at(self, y: float) -> float:
-        pts = self.profile
-        if y <= pts[0][0]:
-            return pts[0][1]
-        if y >= pts[-1][0]:
-            return pts[-1][1]
-        # Linear interpolation
-        for i in range(len(pts) - 1):
-            y0, w0 = pts[i]
-            y1, w1 = pts[i + 1]
-            if y0 <= y <= y1:
-                t = (y - y0) / (y1 - y0)
-                return w0 + t * (w1 - w0)
-        return 0.0
+        ys, ws = self._ys, self._ws
+        if y <= ys[0]:
+            return float(ws[0])
+        if y >= ys[-1]:
+            return float(ws[-1])
+        # Binary search for the bracketing segment, then interpolate
+        i = bisect.bisect_right(ys, y) - 1
+        y0, y1 = ys[i], ys[i + 1]
+        t = (y - y0) / (y1 - y0)
+        return float(ws[i] + t * (ws[i + 1] - ws[i]))
+
+    def widths_at(self, y: np.ndarray) -> np.ndarray:
+        return np.interp(y, self._ys, self._ws)
@@ -10,14 +10,16 @@ Convention: y is measured from the BOTTOM of the section.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
 from typing import List, Optional
 
 from response_yolo.materials.steel import ReinforcingSteel
 
+_PI_OVER_4 = math.pi / 4.0
 
-@dataclass
+
+@dataclass(slots=True)
 class RebarBar:
     """A single reinforcing bar or group of bars at a point.
 
@@ -36,7 +38,7 @@ class RebarBar:
     material: ReinforcingSteel
 
 
-@dataclass
+@dataclass(slots=True)
 class RebarLayer:
     """A layer of reinforcing bars.
 
@@ -57,13 +59,14 @@ class RebarLayer:
     bar_diameter: float
     material: ReinforcingSteel
 
-    @property
-    def bar_area(self) -> float:
-        return math.pi / 4.0 * self.bar_diameter ** 2
+    # Derived areas — computed once at construction rather than per
+    # property access.
+    bar_area: float = field(init=False)
+    total_area: float = field(init=False)
 
-    @property
-    def total_area(self) -> float:
-        return self.n_bars * self.bar_area
+    def __post_init__(self) -> None:
+        self.bar_area = _PI_OVER_4 * self.bar_diameter * self.bar_diameter
+        self.total_area = self.n_bars * self.bar_area
 
     def to_bar(self) -> RebarBar:
         """Convert to a single lumped RebarBar."""
@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from response_yolo.materials.prestressing import PrestressingSteel
 
 
-@dataclass
+@dataclass(slots=True)
 class Tendon:
     """A prestressing tendon or group of strands.
 
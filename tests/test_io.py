@@ -4,6 +4,7 @@ import json
 import pytest
 from pathlib import Path
 
+from response_yolo.cli import main as cli_main
 from response_yolo.io.r2t_parser import parse_r2t
 from response_yolo.io.json_io import load_json_input, save_json_output
 from response_yolo.analysis.moment_curvature import MomentCurvatureAnalysis
@@ -173,6 +174,49 @@ n_steps = 20
         assert all(lay.rho_y == 0 for lay in xs.concrete_layers)
 
 
+class TestCLI:
+    """In-process CLI tests — no subprocess/interpreter startup per case."""
+
+    def test_version(self, capsys):
+        with pytest.raises(SystemExit) as exc:
+            cli_main(["--version"])
+        assert exc.value.code == 0
+        assert "response-yolo" in capsys.readouterr().out
+
+    def test_no_command_prints_help(self, capsys):
+        assert cli_main([]) == 0
+        assert "usage" in capsys.readouterr().out.lower()
+
+    def test_info(self, capsys):
+        rc = cli_main(["info", str(EXAMPLES_DIR / "simple_beam.json")])
+        assert rc == 0
+        assert "Section Properties" in capsys.readouterr().out
+
+    def test_run_writes_output(self, tmp_path, capsys):
+        inp = {
+            "section": {"shape": "rectangular", "b": 300, "h": 500},
+            "concrete": {"fc": 35},
+            "long_steel": {"fy": 400},
+            "rebars": [{"y": 50, "area": 1500}],
+            "analysis": {"type": "moment_curvature", "n_steps": 5},
+        }
+        p = tmp_path / "beam.json"
+        with open(p, "w") as f:
+            json.dump(inp, f)
+        out = tmp_path / "results.json"
+
+        rc = cli_main(["run", str(p), "-o", str(out), "--quiet"])
+        assert rc == 0
+        with open(out) as f:
+            data = json.load(f)
+        assert data["metadata"]["analysis_type"] == "moment_curvature"
+
+    def test_missing_input_exits_nonzero(self):
+        with pytest.raises(SystemExit) as exc:
+            cli_main(["info", "/nonexistent/beam.json"])
+        assert exc.value.code == 1
+
+
 class TestR2TvsJSON:
     """Verify that R2T and JSON inputs produce consistent results."""
 
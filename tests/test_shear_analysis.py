@@ -16,9 +16,14 @@ from response_yolo.analysis.longitudinal_stiffness import (
 # --------------------------------------------------------------------------
 # Fixtures
 # --------------------------------------------------------------------------
-@pytest.fixture
+@pytest.fixture(scope="module")
 def beam_section():
-    """Standard rectangular beam: 300×500mm, fc=35, fy=400, stirrups 10mm@200."""
+    """Standard rectangular beam: 300×500mm, fc=35, fy=400, stirrups 10mm@200.
+
+    Module-scoped: no test mutates the section, so the discretisation
+    cost is paid once per module. Tests that add rebar or stirrups must
+    copy.deepcopy() first.
+    """
     concrete = Concrete(fc=35)
     steel = ReinforcingSteel(fy=400)
     stirrup_steel = ReinforcingSteel(fy=400)
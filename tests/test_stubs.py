@@ -12,7 +12,7 @@ from response_yolo.analysis.stubs import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def section():
     shape = RectangularSection(b=300, h=500)
     concrete = Concrete(fc=30)